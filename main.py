@@ -27,8 +27,35 @@ from src.utils.gpu_utils import get_easyocr_reader
 
 # 全局命令队列
 command_queue = queue.Queue()
-# 全局日志队列
-log_queue = queue.Queue()
+# 全局日志队列（有界：UI长时间未取走时丢弃最旧的日志，避免内存无限增长）
+LOG_QUEUE_MAXSIZE = 10000
+log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+# 日志推送回调（由UI注册；注册后日志直接推送给订阅方，不再进入队列等待轮询）
+_log_callback = None
+
+def set_log_callback(callback):
+    """注册/注销日志推送回调，传入 None 表示注销"""
+    global _log_callback
+    _log_callback = callback
+
+def publish_log(msg: str, target_queue: Optional[queue.Queue] = None):
+    """发布一条日志：已注册回调时直接推送，否则放入日志队列"""
+    callback = _log_callback
+    if callback is not None:
+        callback(msg)
+        return
+    
+    q = target_queue if target_queue is not None else log_queue
+    while True:
+        try:
+            q.put_nowait(msg)
+            return
+        except queue.Full:
+            # 队列已满，丢弃最旧的一条
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
 
 class QueueHandler(logging.Handler):
     """将日志发送到队列的自定义处理器"""
@@ -39,7 +66,7 @@ class QueueHandler(logging.Handler):
     def emit(self, record):
         try:
             msg = self.format(record)
-            self.log_queue.put(msg)
+            publish_log(msg, self.log_queue)
         except Exception:
             self.handleError(record)
 
@@ -10,19 +10,33 @@ import logging
 import threading
 import time
 import json
+import copy
 import shutil
+import sqlite3
+import tempfile
 import queue
 import traceback
 import base64
 import zlib
+import itertools
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTextEdit, QFrame, QStackedWidget, QLineEdit, QGroupBox,
+    QPushButton, QPlainTextEdit, QFrame, QStackedWidget, QLineEdit, QGroupBox,
     QGridLayout, QScrollArea, QSizePolicy, QCheckBox, QMessageBox, QComboBox,
-    QMenu, QAction, QFileDialog, QInputDialog
+    QMenu, QAction, QFileDialog, QInputDialog, QListView, QAbstractItemView,
+    QTableView, QHeaderView, QFormLayout
+)
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QSize, pyqtSlot, QObject, QRunnable, QThreadPool, QElapsedTimer
+)
+from PyQt5.QtGui import (
+    QFont, QPixmap, QPalette, QBrush, QColor, QIcon, QFontDatabase, QPainter, QPen,
+    QImage, QPixmapCache, QStandardItemModel, QStandardItem
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize, pyqtSlot
-from PyQt5.QtGui import QFont, QPixmap, QPalette, QBrush, QColor, QIcon, QFontDatabase, QPainter, QPen
 
 # 设置环境变量以避免PyTorch的pin_memory警告
 os.environ["PIN_MEMORY"] = "false"
@@ -30,21 +44,414 @@ os.environ["PIN_MEMORY"] = "false"
 # 添加src目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-# 导入原有主逻辑
-from main import main as run_main_script
-from main import command_queue, log_queue  # 导入全局命令队列和日志队列
+# 原有主逻辑（main）会连带导入 torch/cv2/easyocr 等重型依赖，
+# 延迟到第一次连接设备时再导入，使界面能立即显示
+_main_module = None
+
+def _lazy_import_main():
+    """首次调用时导入主脚本模块并缓存，返回 main 模块（提供 main/command_queue/log_queue 等）"""
+    global _main_module
+    if _main_module is None:
+        import main as _main_module
+    return _main_module
 
 # 设置字体路径（如果文件不存在则使用默认字体）
 FONT_PATH = "猫啃什锦黑.otf"
 BACKGROUND_IMAGE = "Image/ui背景.jpg"  # 背景图片路径
 
+@lru_cache(maxsize=1)
 def get_exe_dir():
-    """获取 EXE 所在目录（打包后）或脚本目录（直接运行 .py 时）"""
+    """获取 EXE 所在目录（打包后）或脚本目录（直接运行 .py 时）；结果在进程内不变，缓存一次即可"""
     if getattr(sys, 'frozen', False):  # 检查是否打包
         return os.path.dirname(sys.executable)  # EXE 所在目录
     else:
         return os.path.dirname(os.path.abspath(__file__))  # 脚本所在目录
 
+QUANKA_DIR = os.path.join(get_exe_dir(), "quanka")                  # 全部卡片目录
+CARD_DIR = os.path.join(get_exe_dir(), "shadowverse_cards_cost")    # 当前卡组目录
+SAVED_DECKS_DIR = os.path.join(get_exe_dir(), "saved_decks")        # 已保存卡组目录
+CONFIG_PATH = os.path.join(get_exe_dir(), "config.json")            # 配置文件
+
+# JSON 编解码：优先使用 orjson（C 实现），未安装时退回标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(buf):
+    """从 UTF-8 字节解析 JSON"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+def json_dumps_bytes(obj):
+    """将对象序列化为紧凑的 UTF-8 JSON 字节（保留中文）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def json_dumps_pretty(obj):
+    """将对象序列化为缩进 2 的 UTF-8 JSON 字节（保留中文），用于写入文件"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+# 分享码压缩：安装了 zstandard 时使用 zstd（带 1 字节格式标记），否则沿用 zlib
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SHARE_FORMAT_ZSTD = b'\x02'  # zlib 数据流首字节固定为 0x78，不会与该标记冲突
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+def compress_share_payload(raw):
+    """压缩分享数据"""
+    if _ZSTD_COMPRESSOR is not None:
+        return SHARE_FORMAT_ZSTD + _ZSTD_COMPRESSOR.compress(raw)
+    return zlib.compress(raw)
+
+def decompress_share_payload(data):
+    """解压分享数据，兼容旧版 zlib 分享码"""
+    if data[:1] == SHARE_FORMAT_ZSTD:
+        if _ZSTD_DECOMPRESSOR is None:
+            raise ValueError("该分享码使用 zstd 压缩，请先安装 zstandard")
+        return _ZSTD_DECOMPRESSOR.decompress(data[1:])
+    return zlib.decompress(data)
+
+# 分享码文本编码：新分享码为带前缀的 Base85（比 Base64 短约 8%），无前缀的旧分享码按 Base64 解码
+SHARE_CODE_B85_PREFIX = '~'  # 不在 Base64 字母表中，可据此区分新旧分享码
+
+def encode_share_code(data):
+    """把压缩后的分享数据编码为分享码文本"""
+    return SHARE_CODE_B85_PREFIX + base64.b85encode(data).decode('ascii')
+
+def decode_share_code(share_code):
+    """把分享码文本解码为压缩数据"""
+    if share_code.startswith(SHARE_CODE_B85_PREFIX):
+        return base64.b85decode(share_code[len(SHARE_CODE_B85_PREFIX):].encode('ascii'))
+    return base64.b64decode(share_code)
+
+# config.json 解析结果缓存: path -> ((st_mtime_ns, st_size), dict)
+_CONFIG_CACHE = {}
+
+# 配置写入锁：GUI线程与后台保存线程的 读取 -> 合并 -> 写入（含刷新缓存）必须整体持有该锁，避免相互覆盖
+CONFIG_WRITE_LOCK = threading.Lock()
+
+def _config_stat_key(config_path):
+    st = os.stat(config_path)
+    return (st.st_mtime_ns, st.st_size)
+
+def read_config_cached(config_path):
+    """读取配置文件；文件未变化（mtime/size 相同）时直接返回缓存副本，跳过磁盘读取与JSON解析"""
+    try:
+        key = _config_stat_key(config_path)
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
+        return {}
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1])
+    with open(config_path, 'rb') as f:
+        data = json_loads(f.read())
+    _CONFIG_CACHE[config_path] = (key, data)
+    return copy.deepcopy(data)
+
+def update_config_cache(config_path, data):
+    """写入配置文件后直接刷新缓存，避免下次读取时重新解析"""
+    try:
+        _CONFIG_CACHE[config_path] = (_config_stat_key(config_path), copy.deepcopy(data))
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
+
+def write_config_atomic(config_path, data):
+    """整体序列化后写入临时文件再 os.replace，避免写到一半时留下损坏的配置；同时刷新缓存。
+    调用方需持有 CONFIG_WRITE_LOCK，并在同一锁内完成读取与合并"""
+    buf = json_dumps_pretty(data)
+    # 每次写入使用独立的临时文件，并发写入时不会互相截断
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(config_path) or ".", suffix=".tmp")
+    replaced = False
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())  # 确保内容落盘后再替换，断电时也不会换上空文件
+        os.replace(tmp_path, config_path)
+        replaced = True
+    finally:
+        if not replaced:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    update_config_cache(config_path, data)
+
+# 卡片缩略图尺寸很小，最近邻缩放观感差异不大但开销低得多
+THUMBNAIL_TRANSFORM = Qt.FastTransformation
+
+def card_pixmap_key(path, w, h):
+    """卡片缩略图在 QPixmapCache 中的键，文件不存在时返回 None"""
+    # 使用文件名而非完整路径：卡组目录中的卡片是 quanka 的硬链接/副本，修改时间相同，各页面可共用缩略图
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return f"{os.path.basename(path)}|{w}x{h}|{mtime_ns}"
+
+def load_card_pixmap(path, w, h):
+    """获取缩放后的卡片图片（经 QPixmapCache 缓存），文件不存在时返回空 QPixmap"""
+    cache_key = card_pixmap_key(path, w, h)
+    if cache_key is None:
+        return QPixmap()
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        return pixmap
+    pixmap = pixmap.scaled(w, h, Qt.KeepAspectRatio, THUMBNAIL_TRANSFORM)
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+CARD_IMAGE_EXTS = frozenset(('.png', '.jpg', '.jpeg'))
+
+def is_card_image(name):
+    """按扩展名判断是否为卡片图片（只对扩展名做小写转换）"""
+    return os.path.splitext(name)[1].lower() in CARD_IMAGE_EXTS
+
+def iter_card_files(root, _rel_dir="", _category=None):
+    """递归遍历卡片目录，生成 (相对路径, 文件名, 所属分类)；根目录下的卡片分类为 None"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from iter_card_files(entry.path, _rel_dir + entry.name + os.sep, entry.name)
+            elif is_card_image(entry.name) and entry.is_file():
+                yield _rel_dir + entry.name, entry.name, _category
+
+def list_card_files(card_dir):
+    """列出目录（不递归）中的卡片图片文件名"""
+    with os.scandir(card_dir) as entries:
+        return [e.name for e in entries if is_card_image(e.name) and e.is_file()]
+
+# quanka 目录的 文件名 -> 完整路径 索引，目录修改时间变化时重建
+_QUANKA_INDEX = None
+_QUANKA_INDEX_STAMP = None
+# 索引持久化文件，放在 quanka 目录外，避免写入时改变 quanka 自身的修改时间
+QUANKA_INDEX_PATH = os.path.join(get_exe_dir(), "quanka_index.json")
+
+def _quanka_stamp(source_dir):
+    """quanka 根目录及各分类目录的修改时间，任一目录增删文件都会改变该值"""
+    try:
+        stamp = [os.stat(source_dir).st_mtime_ns]
+        with os.scandir(source_dir) as entries:
+            stamp.extend((e.name, e.stat().st_mtime_ns) for e in entries if e.is_dir())
+    except OSError:
+        return None
+    return tuple(stamp)
+
+def _load_quanka_index_file(stamp):
+    """读取持久化的索引 {文件名: 相对路径}，时间戳不一致或文件损坏时返回 None"""
+    try:
+        with open(QUANKA_INDEX_PATH, 'rb') as f:
+            data = json_loads(f.read())
+        saved = data["stamp"]
+        if tuple([saved[0]] + [tuple(p) for p in saved[1:]]) != stamp:
+            return None
+        return data["index"]
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return None
+
+def _save_quanka_index_file(stamp, rel_index):
+    try:
+        with open(QUANKA_INDEX_PATH, 'wb') as f:
+            f.write(json_dumps_bytes({"stamp": stamp, "index": rel_index}))
+    except OSError as e:
+        print(f"保存卡片索引失败: {e}")
+
+def get_quanka_index(refresh=False):
+    """获取 quanka 卡片索引；同名文件保留遍历顺序中第一次出现的路径"""
+    global _QUANKA_INDEX, _QUANKA_INDEX_STAMP
+    source_dir = QUANKA_DIR
+    stamp = _quanka_stamp(source_dir)
+    if _QUANKA_INDEX is None or refresh or stamp != _QUANKA_INDEX_STAMP:
+        rel_index = None
+        if stamp is not None and not refresh:
+            rel_index = _load_quanka_index_file(stamp)
+        if rel_index is None:
+            rel_index = {}
+            if stamp is not None:
+                for rel_path, file, _ in iter_card_files(source_dir):
+                    rel_index.setdefault(file, rel_path)
+                _save_quanka_index_file(stamp, rel_index)
+        _QUANKA_INDEX = {file: os.path.join(source_dir, rel_path) for file, rel_path in rel_index.items()}
+        _QUANKA_INDEX_STAMP = stamp
+    return _QUANKA_INDEX
+
+def read_deck_file(path):
+    """读取卡组 JSON 文件"""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+def write_deck_file(path, deck_data):
+    """写入卡组 JSON 文件（缩进 2，保留中文）；先整体序列化为字节再一次性写入"""
+    buf = json_dumps_pretty(deck_data)
+    with open(path, 'wb') as f:
+        f.write(buf)
+
+# 已保存卡组名称缓存：{文件路径: (mtime_ns, 卡组名)}
+_DECK_NAME_CACHE = {}
+# 卡组名称索引持久化到 saved_decks 目录下的 SQLite 文件，重启后无需逐个打开 JSON
+DECK_INDEX_FILE = "deck_index.sqlite"
+_DECK_INDEX_LOADED = set()
+
+def _open_deck_index(decks_dir):
+    conn = sqlite3.connect(os.path.join(decks_dir, DECK_INDEX_FILE))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS decks ("
+        "file TEXT PRIMARY KEY, name TEXT NOT NULL, mtime_ns INTEGER NOT NULL)"
+    )
+    return conn
+
+def _load_deck_index(decks_dir):
+    """首次列出某目录时，从 SQLite 索引恢复名称缓存"""
+    _DECK_INDEX_LOADED.add(decks_dir)
+    try:
+        conn = _open_deck_index(decks_dir)
+        try:
+            for file, name, mtime_ns in conn.execute("SELECT file, name, mtime_ns FROM decks"):
+                _DECK_NAME_CACHE[os.path.join(decks_dir, file)] = (mtime_ns, name)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"读取卡组索引失败: {e}")
+
+def _save_deck_index(decks_dir, updated, removed):
+    """将新解析的卡组名称写回索引，并删除已不存在的卡组"""
+    try:
+        conn = _open_deck_index(decks_dir)
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO decks VALUES (?, ?, ?)", updated)
+                conn.executemany("DELETE FROM decks WHERE file = ?", [(f,) for f in removed])
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"写入卡组索引失败: {e}")
+
+def list_saved_decks(decks_dir):
+    """列出已保存卡组 [(卡组名, 文件名)]，仅在文件修改后重新解析 JSON"""
+    decks = []
+    if not os.path.isdir(decks_dir):
+        return decks
+    if decks_dir not in _DECK_INDEX_LOADED:
+        _load_deck_index(decks_dir)
+    updated = []
+    with os.scandir(decks_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = _DECK_NAME_CACHE.get(entry.path)
+                if cached and cached[0] == mtime_ns:
+                    name = cached[1]
+                else:
+                    name = read_deck_file(entry.path).get('name', entry.name[:-5])
+                    _DECK_NAME_CACHE[entry.path] = (mtime_ns, name)
+                    updated.append((entry.name, name, mtime_ns))
+            except Exception as e:
+                print(f"读取卡组文件失败: {entry.path} - {e}")
+                continue
+            decks.append((name, entry.name))
+    
+    # 清理已删除卡组的缓存
+    present = {file for _, file in decks}
+    removed = []
+    for path in [p for p in _DECK_NAME_CACHE if os.path.dirname(p) == decks_dir]:
+        file = os.path.basename(path)
+        if file not in present:
+            del _DECK_NAME_CACHE[path]
+            removed.append(file)
+    if updated or removed:
+        _save_deck_index(decks_dir, updated, removed)
+    return decks
+
+def _safe_unlink(path):
+    """删除文件，文件不存在时返回 False（省去先 exists 再删除的额外 stat）"""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+def _reset_deck_dir(path):
+    """清空卡组目录：整体删除后重建"""
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+def _fast_copy(src, dst):
+    """只复制文件内容：Linux 上优先 copy_file_range（支持 CoW 的文件系统无需搬运数据），否则 shutil.copyfile"""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+def _place_card_file(src, dst):
+    """将卡片放入卡组目录：优先创建硬链接，不支持时退回复制"""
+    # 目标残留时（如清空目录失败）：与源是同一文件（硬链接）则无需处理，否则先删除，
+    # 避免复制时以 'wb' 打开目标而经硬链接截断 quanka 中的原图
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError, AttributeError):
+        _fast_copy(src, dst)
+        # 只保留修改时间（缩略图缓存键依赖它），不再复制权限等其余元数据
+        st = os.stat(src)
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+DECK_IO_WORKERS = 8  # 并行放置卡片文件的线程数，文件操作期间会释放GIL
+
+def _place_card_pair(pair):
+    src, dst = pair
+    try:
+        _place_card_file(src, dst)
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        print(f"复制文件失败: {src} -> {dst} - {e}")
+        return False
+
+def place_card_files(pairs):
+    """并行放置 (源, 目标) 卡片文件，返回成功数量；同一目标只放置一次，避免并行写入冲突"""
+    unique_pairs = list({dst: (src, dst) for src, dst in pairs}.values())
+    if not unique_pairs:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(DECK_IO_WORKERS, len(unique_pairs))) as executor:
+        return sum(executor.map(_place_card_pair, unique_pairs))
+
+def start_deck_io(parent, target_dir, pairs, on_finished):
+    """在线程池中重建卡组目录并放入卡片，完成后在GUI线程调用 on_finished(成功数量)"""
+    signals = DeckIOSignals(parent)
+    signals.finished.connect(on_finished)
+    signals.finished.connect(signals.deleteLater)
+    QThreadPool.globalInstance().start(DeckIOJob(target_dir, pairs, signals))
+
 # 创建自定义字体
 def load_custom_font(size=10):
     font = QFont("Microsoft YaHei", size)  # 默认字体
@@ -56,6 +463,154 @@ def load_custom_font(size=10):
                 font = QFont(font_families[0], size)
     return font
 
+# 主窗口样式表
+MAIN_STYLESHEET = """
+    #CentralWidget {
+        background-color: rgba(30, 30, 40, 180);
+        border-radius: 15px;
+        padding: 15px;
+    }
+    QLabel {
+        color: #E0E0FF;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QLineEdit {
+        background-color: rgba(50, 50, 70, 200);
+        color: #FFFFFF;
+        border: 1px solid #5A5A8F;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QPushButton {
+        background-color: #4A4A7F;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 15px;
+        font-weight: bold;
+        min-width: 80px;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #5A5A9F;
+    }
+    QPushButton:pressed {
+        background-color: #3A3A6F;
+    }
+    QPlainTextEdit {
+        background-color: rgba(25, 25, 35, 220);
+        color: #66AAFF;
+        border: 1px solid #444477;
+        border-radius: 5px;
+    }
+    #StatsFrame {
+        background-color: rgba(40, 40, 60, 200);
+        border: 1px solid #555588;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    .StatLabel {
+        color: #AACCFF;
+        font-size: 12px;
+    }
+    .StatValue {
+        color: #FFFF88;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    #TitleLabel {
+        font-size: 20px;
+        color: #88AAFF;
+        font-weight: bold;
+        padding: 10px 0;
+    }
+    #WindowControlButton {
+        background: transparent;
+        border: none;
+        min-width: 30px;
+        max-width: 30px;
+        min-height: 30px;
+        max-height: 30px;
+        padding: 0;
+        margin: 0;
+    }
+    #WindowControlButton:hover {
+        background-color: rgba(255, 255, 255, 30);
+    }
+    #CloseButton:hover {
+        background-color: rgba(255, 0, 0, 100);
+    }
+    QGroupBox {
+        border: 1px solid #555588;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 15px;
+        font-size: 14px;
+        color: #88AAFF;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 5px;
+    }
+    QComboBox {
+        background-color: rgba(80, 80, 120, 180);
+        color: white;
+        border: 1px solid #5A5A8F;
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12px;
+    }
+    QComboBox:hover {
+        background-color: rgba(90, 90, 140, 180);
+    }
+    QToolButton {
+        background: transparent;
+        border: none;
+        color: #88AAFF;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QToolButton:hover {
+        color: #AACCFF;
+    }
+    /* 主页面按钮统一高度 35px（内容高度 19px + 上下内边距各 8px） */
+    QPushButton[mainButton="true"] {
+        min-height: 19px;
+        max-height: 19px;
+    }
+    #ServerCombo, #AdbInput {
+        background-color: rgba(80, 80, 120, 180);
+        color: white;
+    }
+    #DeepColorCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+    }
+    /* 状态标签按 state 属性着色：run 绿色、pause 黄色、stop 红色 */
+    #StatusLabel[state="run"] {
+        color: #55FF55;
+    }
+    #StatusLabel[state="pause"] {
+        color: #FFFF55;
+    }
+    #StatusLabel[state="stop"] {
+        color: #FF5555;
+    }
+"""
+
+# 滚动区域透明样式（卡组选择页与优先级页共用）
+SCROLL_AREA_STYLESHEET = """
+    QScrollArea {
+        background-color: transparent;
+        border: none;
+    }
+    QWidget#ScrollContent {
+        background-color: transparent;
+    }
+"""
+
 class ConfigPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -229,15 +784,12 @@ class ConfigPage(QWidget):
     
     def load_config(self):
         """加载配置文件"""
-        config_path = os.path.join(get_exe_dir(), "config.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"加载配置文件失败: {str(e)}")
-                return {}
-        return {}
+        config_path = CONFIG_PATH
+        try:
+            return read_config_cached(config_path)
+        except Exception as e:
+            print(f"加载配置文件失败: {str(e)}")
+            return {}
     
     def load_card_priority_settings(self, scroll_content):
         """加载卡片优先级设置"""
@@ -249,16 +801,13 @@ class ConfigPage(QWidget):
         self.card_widgets = []
         
         # 获取卡组目录
-        card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
+        card_dir = CARD_DIR
         if not os.path.exists(card_dir):
             QMessageBox.warning(self, "警告", "未找到'shadowverse_cards_cost'文件夹，请先选择卡组！")
             return
         
         # 获取所有卡片文件
-        card_files = []
-        for file in os.listdir(card_dir):
-            if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                card_files.append(file)
+        card_files = list_card_files(card_dir)
         
         # 如果没有卡片，显示提示
         if not card_files:
@@ -281,10 +830,9 @@ class ConfigPage(QWidget):
             
             # 卡片图片
             card_label = QLabel()
-            card_path = os.path.join(get_exe_dir(), "shadowverse_cards_cost", card_file)
-            pixmap = QPixmap(card_path)
+            card_path = os.path.join(CARD_DIR, card_file)
+            pixmap = load_card_pixmap(card_path, 80, 120)
             if not pixmap.isNull():
-                pixmap = pixmap.scaled(80, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 card_label.setPixmap(pixmap)
             card_label.setAlignment(Qt.AlignCenter)
             row_layout.addWidget(card_label)
@@ -381,26 +929,29 @@ class ConfigPage(QWidget):
         
         # 注意：卡牌优先级设置已迁移到独立页面 CardPriorityPage，由它单独保存该部分配置。
         # 这里只保存与参数设置相关的其他字段（如 'game' 和 'auto_restart'）。
-        # 将更新写入磁盘（合并现有配置）。
-        config_path = os.path.join(get_exe_dir(), "config.json")
-        try:
-            # 读取现有配置以保留其它部分（例如 high_priority_cards）
-            existing = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    try:
-                        existing = json.load(f)
-                    except Exception:
-                        existing = {}
-
-            # 合并
-            existing.update(self.config_data)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(existing, f, indent=4, ensure_ascii=False)
+        # 在后台线程中合并现有配置并写入磁盘，避免阻塞界面。
+        # 只提交本页负责的顶层字段，避免用页面打开时的旧副本覆盖其它页面/连接设备后写入的内容
+        updates = {
+            "game": copy.deepcopy(self.config_data["game"]),
+            "auto_restart": copy.deepcopy(self.config_data["auto_restart"]),
+        }
+        config_path = CONFIG_PATH
+        self.save_btn.setEnabled(False)
+        self._save_worker = ConfigSaveWorker(config_path, updates, self)
+        self._save_worker.result_signal.connect(self.on_config_saved)
+        self._save_worker.start()
+
+    def on_config_saved(self, success, error):
+        """后台保存完成回调（在GUI线程执行）"""
+        self.save_btn.setEnabled(True)
+        if success:
+            # 与磁盘同步，拿到其它页面写入的最新字段
+            self.config_data = self.load_config()
             QMessageBox.information(self, "成功", "配置已保存！")
-            self.parent.log_output.append("[配置] 参数设置已更新")
-        except Exception as e:
-            QMessageBox.warning(self, "保存失败", f"保存配置文件时出错: {str(e)}")
+            self.parent.append_log("[配置] 参数设置已更新")
+        else:
+            QMessageBox.warning(self, "保存失败", f"保存配置文件时出错: {error}")
+
     def refresh_config_display(self):
         """刷新整个配置页面的显示"""
         # 重新加载配置数据
@@ -416,12 +967,142 @@ class ConfigPage(QWidget):
         # 卡片优先级已移至独立页面，主配置页不再直接刷新该部分
         return
 
-class CardSelectPage(QWidget):
+class DeckIOMixin:
+    """卡组页面共用的已保存卡组读写逻辑（需要 self.parent 与 self.saved_decks_combo）"""
+
+    def _read_saved_deck(self, deck_file):
+        """读取 saved_decks 中的卡组文件"""
+        decks_dir = SAVED_DECKS_DIR
+        return read_deck_file(os.path.join(decks_dir, deck_file))
+
+    def _write_saved_deck(self, deck_name, cards):
+        """将卡片列表保存为命名卡组，成功时提示并刷新列表"""
+        try:
+            # 创建保存卡组的目录
+            decks_dir = SAVED_DECKS_DIR
+            os.makedirs(decks_dir, exist_ok=True)
+            
+            # 构建卡组数据
+            deck_data = {
+                "name": deck_name,
+                "cards": cards,
+                "timestamp": int(time.time())
+            }
+            
+            # 保存到文件
+            deck_file = os.path.join(decks_dir, f"{deck_name}.json")
+            write_deck_file(deck_file, deck_data)
+            
+            QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已保存！")
+            self.parent.append_log(f"[卡组] 已保存卡组 '{deck_name}'")
+            
+            # 刷新已保存卡组列表
+            self.refresh_saved_decks()
+            return True
+            
+        except Exception as e:
+            QMessageBox.warning(self, "错误", f"保存卡组失败: {str(e)}")
+            self.parent.append_log(f"[卡组] 保存卡组失败: {str(e)}")
+            return False
+
+    def refresh_saved_decks(self):
+        """刷新已保存卡组列表"""
+        self.saved_decks_combo.clear()
+        self.saved_decks_combo.addItem("选择卡组", None)
+        
+        decks_dir = SAVED_DECKS_DIR
+        for name, file in list_saved_decks(decks_dir):
+            self.saved_decks_combo.addItem(name, file)
+
+    def delete_selected_deck(self):
+        """删除选中的已保存卡组"""
+        deck_file = self.saved_decks_combo.itemData(self.saved_decks_combo.currentIndex())
+        deck_name = self.saved_decks_combo.currentText()
+        
+        if not deck_file:
+            QMessageBox.warning(self, "警告", "请选择要删除的卡组！")
+            return
+        
+        reply = QMessageBox.question(
+            self, '确认删除',
+            f'确定要删除卡组 "{deck_name}" 吗？此操作不可撤销！',
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            try:
+                decks_dir = SAVED_DECKS_DIR
+                deck_path = os.path.join(decks_dir, deck_file)
+                
+                if _safe_unlink(deck_path):
+                    
+                    QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已删除！")
+                    self.parent.append_log(f"[卡组] 已删除卡组 '{deck_name}'")
+                    
+                    # 刷新已保存卡组列表
+                    self.refresh_saved_decks()
+                    
+            except Exception as e:
+                QMessageBox.warning(self, "错误", f"删除卡组失败: {str(e)}")
+                self.parent.append_log(f"[卡组] 删除卡组失败: {str(e)}")
+
+class CardSelectPage(DeckIOMixin, QWidget):
+    PAGE_STYLE = """
+        QWidget#CardSlot {
+            background-color: rgba(60, 60, 90, 150);
+            border-radius: 10px;
+        }
+        QLabel#CardName {
+            color: #FFFFFF;
+            background-color: transparent;
+            font-weight: bold;
+            font-size: 12px;
+            padding: 2px;
+            max-width: %dpx;
+        }
+        QCheckBox#CardCheckBox {
+            color: #FFFFFF;
+            background-color: rgba(80, 80, 120, 180);
+            border-radius: 5px;
+            padding: 2px 5px;
+            font-size: 12px;
+        }
+        QCheckBox#CardCheckBox::indicator {
+            width: 15px;
+            height: 15px;
+        }
+        QPushButton[costFilter="true"] {
+            background-color: #4A4A7F;
+            color: white;
+            border: none;
+            padding: 5px 8px;
+            min-width: 40px;
+            border-radius: 4px;
+            margin: 2px;
+        }
+        QPushButton[costFilter="true"]:checked {
+            background-color: #88AAFF;
+            font-weight: bold;
+        }
+        QPushButton[costFilter="true"]:hover {
+            background-color: #5A5A9F;
+        }
+        QPushButton#AllCostButton {
+            background-color: #88AAFF;
+            color: white;
+            font-weight: bold;
+            padding: 5px 10px;
+            border-radius: 4px;
+            margin: 2px;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.current_page = 0
         self.selected_cards = []
+        self._selected_set = set()  # 与 selected_cards 同步，用于 O(1) 成员判断
         self.cards_per_row = 4
         self.card_size = QSize(100, 140)  # 减小卡片尺寸以显示更多图片
         self.cost_filters = {}  # 存储费用筛选按钮
@@ -429,12 +1110,36 @@ class CardSelectPage(QWidget):
         self.filtered_cards = [] # 筛选后的卡片
         self.card_categories = []  # 卡片分类
         self.current_category = None  # 当前选择的分类
+        self._by_cost = defaultdict(list)      # 费用 -> 卡片（已排序）
+        self._by_category = defaultdict(list)  # 分类 -> 卡片（已排序）
+        self._card_by_file = {}                # 文件名 -> 卡片
+        self._card_slots = []  # 可复用的卡片槽位控件
+        self._slot_by_file = {}  # 当前页 卡片文件名 -> 槽位
+        self._last_filter_state = None  # 上次筛选条件 (分类, 费用, 搜索文本)
+        # 后台解码卡片图片，结果通过信号回到GUI线程
+        self._decode_pool = QThreadPool.globalInstance()
+        self._decode_signals = CardImageDecodeSignals(self)
+        self._decode_signals.decoded.connect(self._on_card_image_decoded)
+        self._decode_generation = 0  # 每次翻页递增，丢弃过期的解码结果
+        # 搜索/分类筛选防抖：连续输入只在停顿后刷新一次
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.update_card_display)
+        # 窗口缩放节流：拖动结束后再重新排布卡片
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self.adjust_card_layout)
         self.init_ui()
 
     def init_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(15)
         
+        # 卡片槽位与费用按钮的样式统一在页面级设置，只解析一次
+        self.setStyleSheet(self.PAGE_STYLE % (self.card_size.width() - 10))
+        
         # 标题
         title_label = QLabel("卡组选择")
         title_label.setStyleSheet("font-size: 20px; color: #88AAFF; font-weight: bold;")
@@ -524,15 +1229,7 @@ class CardSelectPage(QWidget):
         self.scroll_area.setWidget(self.scroll_content)
         
         # 设置滚动区域样式
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QWidget#ScrollContent {
-                background-color: transparent;
-            }
-        """)
+        self.scroll_area.setStyleSheet(SCROLL_AREA_STYLESHEET)
         self.scroll_content.setObjectName("ScrollContent")
         main_layout.addWidget(self.scroll_area)
         
@@ -580,58 +1277,33 @@ class CardSelectPage(QWidget):
         for cost in range(0, 11):
             btn = QPushButton(f"{cost}费")
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A4A7F;
-                    color: white;
-                    border: none;
-                    padding: 5px 8px;
-                    min-width: 40px;
-                    border-radius: 4px;
-                    margin: 2px;
-                }
-                QPushButton:checked {
-                    background-color: #88AAFF;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #5A5A9F;
-                }
-            """)
+            btn.setProperty("costFilter", True)
             btn.clicked.connect(self.update_card_display)
             self.cost_filters[cost] = btn
             cost_filter_layout.addWidget(btn)
         
         # 添加"全部"按钮
         all_btn = QPushButton("全部")
+        all_btn.setObjectName("AllCostButton")
         all_btn.setCheckable(True)
         all_btn.setChecked(True)
-        all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #88AAFF;
-                color: white;
-                font-weight: bold;
-                padding: 5px 10px;
-                border-radius: 4px;
-                margin: 2px;
-            }
-        """)
         all_btn.clicked.connect(self.select_all_costs)
         cost_filter_layout.addWidget(all_btn)
+        self._all_btn = all_btn
         
         cost_filter_layout.addStretch()
         main_layout.addLayout(cost_filter_layout)
 
     def load_cards(self):
         """加载所有卡片和分类"""
-        card_dir = os.path.join(get_exe_dir(), "quanka")
+        card_dir = QUANKA_DIR
         self.all_cards = []
         self.card_categories = []
         
         if os.path.exists(card_dir):
             # 获取所有分类文件夹
-            self.card_categories = [d for d in os.listdir(card_dir) 
-                                  if os.path.isdir(os.path.join(card_dir, d))]
+            with os.scandir(card_dir) as entries:
+                self.card_categories = [e.name for e in entries if e.is_dir()]
             
             # 更新分类下拉框
             self.category_combo.clear()
@@ -640,35 +1312,44 @@ class CardSelectPage(QWidget):
             for category in sorted(self.card_categories):
                 self.category_combo.addItem(category, category)
             
-            # 加载所有卡片
-            for root, _, files in os.walk(card_dir):
-                for file in files:
-                    if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                        # 存储相对路径和分类信息
-                        rel_path = os.path.relpath(os.path.join(root, file), card_dir)
-                        self.all_cards.append({
-                            "path": rel_path,
-                            "file": file,
-                            "category": os.path.basename(root) if root != card_dir else None
-                        })
+            # 加载所有卡片（存储相对路径和分类信息）
+            for rel_path, file, category in iter_card_files(card_dir):
+                self.all_cards.append({
+                    "path": rel_path,
+                    "file": file,
+                    "category": category,
+                    # 预先计算筛选/显示所需字段，避免每次筛选重复解析
+                    "file_lower": file.lower(),
+                    "cost": self.get_card_cost(file),
+                    "display_name": ' '.join(file.split('_', 1)[-1].rsplit('.', 1)[0].split('_'))
+                })
         
         # 按费用和名称排序
-        self.all_cards.sort(key=lambda x: (
-            self.get_card_cost(x["file"]), 
-            x["file"].lower()
-        ))
+        self.all_cards.sort(key=itemgetter("cost", "file_lower"))
+        
+        # 建立费用/分类索引，筛选时只遍历命中的分组
+        self._by_cost = defaultdict(list)
+        self._by_category = defaultdict(list)
+        for card in self.all_cards:
+            self._by_cost[card["cost"]].append(card)
+            self._by_category[card["category"]].append(card)
+        # 文件名索引（同名卡片保留排序后的第一张，与原先线性查找结果一致）
+        self._card_by_file = {}
+        for card in self.all_cards:
+            self._card_by_file.setdefault(card["file"], card)
         
         self.filtered_cards = self.all_cards
+        self._last_filter_state = None
         self.display_page(0)
 
     def on_category_changed(self, index):
         """分类选择改变事件"""
         self.current_category = self.category_combo.itemData(index)
-        self.update_card_display()
+        self._search_timer.start()
 
     def on_search_text_changed(self, text):
         """搜索文本改变事件"""
-        self.update_card_display()
+        self._search_timer.start()
 
     def select_all_costs(self):
         """选择全部费用"""
@@ -685,29 +1366,38 @@ class CardSelectPage(QWidget):
         selected_costs = [cost for cost, btn in self.cost_filters.items() if btn.isChecked()]
         
         # 更新"全部"按钮状态
-        all_btn = self.sender() if isinstance(self.sender(), QPushButton) and self.sender().text() == "全部" else None
-        if not all_btn:
-            for btn in self.findChildren(QPushButton):
-                if btn.text() == "全部":
-                    btn.setChecked(False)
-                    break
+        if self.sender() is not self._all_btn:
+            self._all_btn.setChecked(False)
         
         # 获取搜索文本
         search_text = self.search_input.text().strip().lower()
         
+        # 筛选条件未变化时跳过筛选，只重置到第一页
+        filter_state = (self.current_category, tuple(sorted(selected_costs)), search_text)
+        if filter_state == self._last_filter_state:
+            self.current_page = 0
+            self.display_page(self.current_page)
+            return
+        self._last_filter_state = filter_state
+        
+        # 选取候选集合：按费用升序拼接费用分组可保持原有排序；否则使用分类分组
+        if selected_costs:
+            candidates = itertools.chain.from_iterable(
+                self._by_cost.get(cost, ()) for cost in sorted(selected_costs))
+        elif self.current_category:
+            candidates = self._by_category.get(self.current_category, ())
+        else:
+            candidates = self.all_cards
+        
         # 筛选卡片
         self.filtered_cards = []
-        for card in self.all_cards:
+        for card in candidates:
             # 分类筛选
             if self.current_category and card["category"] != self.current_category:
                 continue
                 
-            # 费用筛选
-            if selected_costs and self.get_card_cost(card["file"]) not in selected_costs:
-                continue
-                
             # 搜索筛选
-            if search_text and search_text not in card["file"].lower():
+            if search_text and search_text not in card["file_lower"]:
                 continue
                 
             self.filtered_cards.append(card)
@@ -726,7 +1416,7 @@ class CardSelectPage(QWidget):
     def resizeEvent(self, event):
         """窗口大小改变时调整布局"""
         super().resizeEvent(event)
-        self.adjust_card_layout()
+        self._resize_timer.start()
 
     def adjust_card_layout(self):
         """根据窗口大小调整卡片布局"""
@@ -745,107 +1435,163 @@ class CardSelectPage(QWidget):
         self.prev_btn.setEnabled(page > 0)
         self.next_btn.setEnabled(page < self.total_pages - 1)
         
-        # 清空现有内容
-        for i in reversed(range(self.grid_layout.count())): 
-            if widget := self.grid_layout.itemAt(i).widget():
-                widget.deleteLater()
+        self._decode_generation += 1
+        
+        # 批量更新期间暂停重绘，结束后统一刷新一次
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            # 添加当前页卡片（复用卡片槽位控件，只更新内容）
+            start_index = page * cards_per_page
+            end_index = min(start_index + cards_per_page, len(self.filtered_cards))
+            visible_count = end_index - start_index
+            self._slot_by_file = {}
+        
+            for i in range(visible_count):
+                card_data = self.filtered_cards[start_index + i]
+                card_path = os.path.join(QUANKA_DIR, card_data["path"])
+                slot = self._get_card_slot(i)
+                slot["file"] = card_data["file"]
+                self._slot_by_file[card_data["file"]] = slot
+            
+                # 按当前每行数量放置槽位
+                pos = divmod(i, self.cards_per_row)
+                if slot["pos"] != pos:
+                    self.grid_layout.removeWidget(slot["container"])
+                    self.grid_layout.addWidget(slot["container"], *pos)
+                    slot["pos"] = pos
+            
+                # 卡片图片：命中缓存直接显示，否则先清空再交给后台线程解码
+                self._show_card_image(i, slot, card_path)
+            
+                # 卡片名称与选择状态
+                slot["name_label"].setText(card_data["display_name"])
+                checkbox = slot["checkbox"]
+                checkbox.blockSignals(True)
+                checkbox.setChecked(card_data["file"] in self._selected_set)
+                checkbox.blockSignals(False)
+                slot["container"].setVisible(True)
+        
+            # 隐藏多余的槽位
+            for slot in self._card_slots[visible_count:]:
+                slot["file"] = None
+                slot["pixmap_key"] = None
+                slot["container"].setVisible(False)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
+    def _show_card_image(self, index, slot, card_path):
+        """显示槽位图片：QPixmapCache 命中则直接设置，未命中则异步解码"""
+        cache_key = card_pixmap_key(card_path, self.card_size.width(), self.card_size.height())
+        slot["pixmap_key"] = cache_key
+        if cache_key is None:
+            slot["pixmap_label"].clear()
+            return
         
-        # 添加当前页卡片
-        start_index = page * cards_per_page
-        end_index = min(start_index + cards_per_page, len(self.filtered_cards))
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            slot["pixmap_label"].setPixmap(pixmap)
+            return
         
-        row, col = 0, 0
-        for i in range(start_index, end_index):
-            card_data = self.filtered_cards[i]
-            card_path = os.path.join(get_exe_dir(), "quanka", card_data["path"])
-            
+        slot["pixmap_label"].clear()
+        self._decode_pool.start(CardImageDecodeTask(
+            self._decode_generation, index, card_path, cache_key, self.card_size, self._decode_signals))
+
+    def _on_card_image_decoded(self, generation, index, cache_key, image):
+        """后台解码完成（GUI线程）：写入缓存，并在槽位仍显示该卡片时更新图片"""
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        if generation != self._decode_generation or index >= len(self._card_slots):
+            return
+        slot = self._card_slots[index]
+        if slot["pixmap_key"] == cache_key:
+            slot["pixmap_label"].setPixmap(pixmap)
+
+    def _get_card_slot(self, index):
+        """获取（必要时创建）第 index 个卡片槽位控件"""
+        while len(self._card_slots) <= index:
             # 创建卡片容器
             card_container = QWidget()
-            card_container.setStyleSheet("""
-                background-color: rgba(60, 60, 90, 150);
-                border-radius: 10px;
-            """)
+            card_container.setObjectName("CardSlot")
+            card_container.setAttribute(Qt.WA_StyledBackground, True)
             card_layout = QVBoxLayout(card_container)
             card_layout.setAlignment(Qt.AlignCenter)
             card_layout.setSpacing(5)
             card_layout.setContentsMargins(5, 5, 5, 5)
             
+            slot = {"container": card_container, "file": None, "pos": None, "pixmap_key": None}
+            
             # 卡片图片
             card_label = QLabel()
-            pixmap = QPixmap(card_path)
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(self.card_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                card_label.setPixmap(pixmap)
             card_label.setAlignment(Qt.AlignCenter)
-            card_label.mousePressEvent = lambda event, f=card_data["file"]: self.toggle_card_selection_by_click(f)
+            card_label.mousePressEvent = lambda event, s=slot: self._on_slot_clicked(s)
             
             # 卡片名称
-            card_name = ' '.join(card_data["file"].split('_', 1)[-1].rsplit('.', 1)[0].split('_'))
-            name_label = QLabel(card_name)
-            name_label.setStyleSheet("""
-                QLabel {
-                    color: #FFFFFF;
-                    background-color: transparent;
-                    font-weight: bold;
-                    font-size: 12px;
-                    padding: 2px;
-                    max-width: %dpx;
-                }
-            """ % (self.card_size.width() - 10))
+            name_label = QLabel()
+            name_label.setObjectName("CardName")
             name_label.setAlignment(Qt.AlignCenter)
             name_label.setWordWrap(True)
             
             # 选择框
             checkbox = QCheckBox("选择")
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: #FFFFFF;
-                    background-color: rgba(80, 80, 120, 180);
-                    border-radius: 5px;
-                    padding: 2px 5px;
-                    font-size: 12px;
-                }
-                QCheckBox::indicator {
-                    width: 15px;
-                    height: 15px;
-                }
-            """)
-            checkbox.setChecked(card_data["file"] in self.selected_cards)
-            checkbox.stateChanged.connect(lambda state, f=card_data["file"]: self.toggle_card_selection(f, state))
+            checkbox.setObjectName("CardCheckBox")
+            checkbox.stateChanged.connect(lambda state, s=slot: self._on_slot_state_changed(s, state))
             
             card_layout.addWidget(card_label)
             card_layout.addWidget(name_label)
             card_layout.addWidget(checkbox)
-            self.grid_layout.addWidget(card_container, row, col)
             
-            col += 1
-            if col >= self.cards_per_row:
-                col = 0
-                row += 1
+            slot["pixmap_label"] = card_label
+            slot["name_label"] = name_label
+            slot["checkbox"] = checkbox
+            self._card_slots.append(slot)
+        return self._card_slots[index]
+
+    def _on_slot_clicked(self, slot):
+        """点击槽位图片时按槽位当前绑定的卡片切换选择"""
+        if slot["file"]:
+            self.toggle_card_selection_by_click(slot["file"])
+
+    def _on_slot_state_changed(self, slot, state):
+        """槽位复选框状态变化"""
+        if slot["file"]:
+            self.toggle_card_selection(slot["file"], state)
 
     def toggle_card_selection(self, card_file, state):
         """复选框选择卡片"""
         if state == Qt.Checked:
-            if card_file not in self.selected_cards:
+            if card_file not in self._selected_set:
                 if len(self.selected_cards) < 100:
                     self.selected_cards.append(card_file)
+                    self._selected_set.add(card_file)
                 else:
                     self.sender().setChecked(False)
                     QMessageBox.warning(self, "警告", "最多只能选择100张卡片！")
         else:
-            if card_file in self.selected_cards:
+            if card_file in self._selected_set:
                 self.selected_cards.remove(card_file)
+                self._selected_set.discard(card_file)
 
     def toggle_card_selection_by_click(self, card_file):
         """点击图片选择卡片"""
-        if card_file in self.selected_cards:
+        if card_file in self._selected_set:
             self.selected_cards.remove(card_file)
+            self._selected_set.discard(card_file)
         else:
             if len(self.selected_cards) < 100:
                 self.selected_cards.append(card_file)
+                self._selected_set.add(card_file)
             else:
                 QMessageBox.warning(self, "警告", "最多只能选择100张卡片！")
-        self.display_page(self.current_page)  # 刷新页面更新复选框状态
+        
+        # 只同步被点击卡片的复选框，无需重绘整页
+        slot = self._slot_by_file.get(card_file)
+        if slot:
+            checkbox = slot["checkbox"]
+            checkbox.blockSignals(True)
+            checkbox.setChecked(card_file in self._selected_set)
+            checkbox.blockSignals(False)
 
     def prev_page(self):
         """上一页"""
@@ -863,39 +1609,24 @@ class CardSelectPage(QWidget):
             QMessageBox.warning(self, "警告", "请至少选择一张卡片！")
             return
         
-        target_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-        os.makedirs(target_dir, exist_ok=True)
+        target_dir = CARD_DIR
         
-        # 清空目标文件夹，然后添加所有选中的卡片
-        for file in os.listdir(target_dir):
-            file_path = os.path.join(target_dir, file)
-            try:
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            except Exception as e:
-                print(f"删除文件失败: {file_path} - {e}")
-        
-        # 复制选中的卡片
-        success_count = 0
+        # 在GUI线程整理 (源, 目标) 列表，清空目录与复制交给线程池
+        pairs = []
         for card_file in self.selected_cards:
-            # 查找卡片完整路径
-            src = None
-            for card in self.all_cards:
-                if card["file"] == card_file:
-                    src = os.path.join(get_exe_dir(), "quanka", card["path"])
-                    break
-            
-            if src and os.path.exists(src):
-                dst = os.path.join(target_dir, card_file)
-                try:
-                    shutil.copy2(src, dst)
-                    success_count += 1
-                except Exception as e:
-                    print(f"复制文件失败: {src} -> {dst} - {e}")
+            card = self._card_by_file.get(card_file)
+            if card:
+                pairs.append((os.path.join(QUANKA_DIR, card["path"]), os.path.join(target_dir, card_file)))
         
+        self.save_btn.setEnabled(False)
+        start_deck_io(self, target_dir, pairs, self.on_selection_saved)
+    
+    def on_selection_saved(self, success_count):
+        """卡组文件写入完成后的回调"""
+        self.save_btn.setEnabled(True)
         if success_count > 0:
             QMessageBox.information(self, "成功", f"已保存 {success_count} 张卡片到卡组！")
-            self.parent.log_output.append(f"[卡组] 已保存 {success_count} 张卡片")
+            self.parent.append_log(f"[卡组] 已保存 {success_count} 张卡片")
 
             # 刷新卡牌优先级页面的卡片显示（迁移后）
             if hasattr(self.parent, 'card_priority_page'):
@@ -905,307 +1636,92 @@ class CardSelectPage(QWidget):
             if hasattr(self.parent, 'my_deck_page'):
                 self.parent.my_deck_page.load_deck()
     
-
-    
-    def save_current_deck(self):
-        """保存当前卡组"""
-        deck_name = self.save_deck_name.text().strip()
-        if not deck_name:
-            QMessageBox.warning(self, "警告", "请输入卡组名称！")
+    def save_deck_as(self):
+        """将当前选择的卡组另存为"""
+        if not self.selected_cards:
+            QMessageBox.warning(self, "警告", "请至少选择一张卡片！")
             return
         
-        # 获取当前卡组中的卡片
-        card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-        if not os.path.exists(card_dir):
-            QMessageBox.warning(self, "警告", "当前卡组为空！")
+        # 获取卡组名称
+        deck_name, ok = QInputDialog.getText(self, "保存卡组", "请输入卡组名称:")
+        if not ok or not deck_name.strip():
             return
         
-        card_files = [f for f in os.listdir(card_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-        if not card_files:
-            QMessageBox.warning(self, "警告", "当前卡组为空！")
-            return
+        # 保存卡组
+        self.save_named_deck(deck_name.strip())
         
-        try:
-            # 创建保存卡组的目录
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            os.makedirs(decks_dir, exist_ok=True)
-            
-            # 构建卡组数据
-            deck_data = {
-                "name": deck_name,
-                "cards": card_files,
-                "timestamp": int(time.time())
-            }
-            
-            # 保存到文件
-            deck_file = os.path.join(decks_dir, f"{deck_name}.json")
-            with open(deck_file, 'w', encoding='utf-8') as f:
-                json.dump(deck_data, f, ensure_ascii=False, indent=2)
-            
-            QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已保存！")
-            self.parent.log_output.append(f"[卡组] 已保存卡组 '{deck_name}'")
-            
-            # 清空输入框
-            self.save_deck_name.clear()
-            
-            # 刷新已保存卡组列表
-            self.refresh_saved_decks()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"保存卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 保存卡组失败: {str(e)}")
+    def save_named_deck(self, deck_name):
+        """保存命名卡组"""
+        self._write_saved_deck(deck_name, self.selected_cards)
     
-    def load_selected_deck(self):
+    def refresh_saved_decks(self):
+        """刷新已保存卡组列表"""
+        super().refresh_saved_decks()
+        
+        # 同时刷新MyDeckPage中的卡组列表
+        if hasattr(self.parent, 'my_deck_page'):
+            self.parent.my_deck_page.refresh_saved_decks()
+    
+    def load_saved_deck(self, index):
         """加载选中的已保存卡组"""
-        deck_file = self.saved_decks_combo.itemData(self.saved_decks_combo.currentIndex())
+        deck_file = self.saved_decks_combo.itemData(index)
         if not deck_file:
-            QMessageBox.warning(self, "警告", "请选择要加载的卡组！")
             return
         
         try:
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            deck_path = os.path.join(decks_dir, deck_file)
-            
-            with open(deck_path, 'r', encoding='utf-8') as f:
-                deck_data = json.load(f)
+            deck_data = self._read_saved_deck(deck_file)
             
-            # 清空当前卡组
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-            for file in os.listdir(card_dir):
-                file_path = os.path.join(card_dir, file)
-                try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                except Exception as e:
-                    print(f"删除文件失败: {file_path} - {e}")
+            # 清空当前选择
+            self.selected_cards = []
+            self._selected_set = set()
             
-            # 复制卡片到当前卡组
-            source_dir = os.path.join(get_exe_dir(), "quanka")
-            success_count = 0
+            # 添加卡组中的卡片
             for card_file in deck_data.get('cards', []):
-                # 查找卡片在quanka目录中的路径
-                src = None
-                for root, _, files in os.walk(source_dir):
-                    if card_file in files:
-                        src = os.path.join(root, card_file)
-                        break
-                
-                if src and os.path.exists(src):
-                    dst = os.path.join(card_dir, card_file)
-                    try:
-                        shutil.copy2(src, dst)
-                        success_count += 1
-                    except Exception as e:
-                        print(f"复制文件失败: {src} -> {dst} - {e}")
-            
-            if success_count > 0:
-                # 重新加载卡组显示
-                self.load_deck()
-                
-                QMessageBox.information(self, "成功", f"已加载卡组 '{deck_data.get('name')}'，共 {success_count} 张卡片")
-                self.parent.log_output.append(f"[卡组] 已加载卡组 '{deck_data.get('name')}'")
-                
-                # 刷新卡牌优先级页面（已迁移）
-                if hasattr(self.parent, 'card_priority_page'):
-                    self.parent.card_priority_page.refresh_card_priority()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"加载卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 加载卡组失败: {str(e)}")
-        
-        try:
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            deck_path = os.path.join(decks_dir, deck_file)
-            
-            with open(deck_path, 'r', encoding='utf-8') as f:
-                deck_data = json.load(f)
-            
-            # 清空当前卡组
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-            for file in os.listdir(card_dir):
-                file_path = os.path.join(card_dir, file)
-                try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                except Exception as e:
-                    print(f"删除文件失败: {file_path} - {e}")
+                if card_file not in self._selected_set:
+                    self.selected_cards.append(card_file)
+                    self._selected_set.add(card_file)
             
-            # 复制卡片到当前卡组
-            source_dir = os.path.join(get_exe_dir(), "quanka")
-            success_count = 0
-            for card_file in deck_data.get('cards', []):
-                # 查找卡片在quanka目录中的路径
-                src = None
-                for root, _, files in os.walk(source_dir):
-                    if card_file in files:
-                        src = os.path.join(root, card_file)
-                        break
-                
-                if src and os.path.exists(src):
-                    dst = os.path.join(card_dir, card_file)
-                    try:
-                        shutil.copy2(src, dst)
-                        success_count += 1
-                    except Exception as e:
-                        print(f"复制文件失败: {src} -> {dst} - {e}")
+            # 刷新显示
+            self.display_page(self.current_page)
             
-            if success_count > 0:
-                # 重新加载卡组显示
-                self.load_deck()
-                
-                QMessageBox.information(self, "成功", f"已加载卡组 '{deck_data.get('name')}'，共 {success_count} 张卡片")
-                self.parent.log_output.append(f"[卡组] 已加载卡组 '{deck_data.get('name')}'")
-                
-                # 刷新卡牌优先级页面（已迁移）
-                if hasattr(self.parent, 'card_priority_page'):
-                    self.parent.card_priority_page.refresh_card_priority()
+            QMessageBox.information(self, "成功", f"已加载卡组 '{deck_data.get('name')}'")
+            self.parent.append_log(f"[卡组] 已加载卡组 '{deck_data.get('name')}'")
             
         except Exception as e:
             QMessageBox.warning(self, "错误", f"加载卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 加载卡组失败: {str(e)}")
+            self.parent.append_log(f"[卡组] 加载卡组失败: {str(e)}")
+
+class MyDeckPage(DeckIOMixin, QWidget):
+    PAGE_STYLE = """
+        QListView#DeckCardView {
+            background-color: transparent;
+            border: none;
+        }
+        QListView#DeckCardView::item {
+            background-color: rgba(60, 60, 90, 150);
+            border-radius: 10px;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 12px;
+            padding: 5px;
+        }
+    """
+    CARD_FILE_ROLE = Qt.UserRole + 1  # 模型项中保存卡片文件名的角色
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent = parent
+        self.card_size = QSize(100, 140)  # 标准卡片尺寸
+        self.cards_per_row = 4
+        self.current_deck_cards = None  # 当前卡组卡片文件名，随 load_deck 更新
+        self.init_ui()
     
-    def delete_selected_deck(self):
-        """删除选中的已保存卡组"""
-        deck_file = self.saved_decks_combo.itemData(self.saved_decks_combo.currentIndex())
-        deck_name = self.saved_decks_combo.currentText()
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(15)
         
-        if not deck_file:
-            QMessageBox.warning(self, "警告", "请选择要删除的卡组！")
-            return
-        
-        reply = QMessageBox.question(
-            self, '确认删除',
-            f'确定要删除卡组 "{deck_name}" 吗？此操作不可撤销！',
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-                deck_path = os.path.join(decks_dir, deck_file)
-                
-                if os.path.exists(deck_path):
-                    os.remove(deck_path)
-                    
-                    QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已删除！")
-                    self.parent.log_output.append(f"[卡组] 已删除卡组 '{deck_name}'")
-                    
-                    # 刷新已保存卡组列表
-                    self.refresh_saved_decks()
-                    
-                    # 刷新我的卡组页面
-                    if hasattr(self.parent, 'my_deck_page'):
-                        self.parent.my_deck_page.refresh_saved_decks()
-                    
-            except Exception as e:
-                QMessageBox.warning(self, "错误", f"删除卡组失败: {str(e)}")
-                self.parent.log_output.append(f"[卡组] 删除卡组失败: {str(e)}")
-                
-    def save_deck_as(self):
-        """将当前选择的卡组另存为"""
-        if not self.selected_cards:
-            QMessageBox.warning(self, "警告", "请至少选择一张卡片！")
-            return
-        
-        # 获取卡组名称
-        deck_name, ok = QInputDialog.getText(self, "保存卡组", "请输入卡组名称:")
-        if not ok or not deck_name.strip():
-            return
-        
-        # 保存卡组
-        self.save_named_deck(deck_name.strip())
-        
-    def save_named_deck(self, deck_name):
-        """保存命名卡组"""
-        try:
-            # 创建保存卡组的目录
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            os.makedirs(decks_dir, exist_ok=True)
-            
-            # 构建卡组数据
-            deck_data = {
-                "name": deck_name,
-                "cards": self.selected_cards,
-                "timestamp": int(time.time())
-            }
-            
-            # 保存到文件
-            deck_file = os.path.join(decks_dir, f"{deck_name}.json")
-            with open(deck_file, 'w', encoding='utf-8') as f:
-                json.dump(deck_data, f, ensure_ascii=False, indent=2)
-            
-            QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已保存！")
-            self.parent.log_output.append(f"[卡组] 已保存卡组 '{deck_name}'")
-            
-            # 刷新已保存卡组列表
-            self.refresh_saved_decks()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"保存卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 保存卡组失败: {str(e)}")
-    
-    def refresh_saved_decks(self):
-        """刷新已保存卡组列表"""
-        self.saved_decks_combo.clear()
-        self.saved_decks_combo.addItem("选择卡组", None)
-        
-        decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-        if os.path.exists(decks_dir):
-            for file in os.listdir(decks_dir):
-                if file.endswith('.json'):
-                    deck_file = os.path.join(decks_dir, file)
-                    try:
-                        with open(deck_file, 'r', encoding='utf-8') as f:
-                            deck_data = json.load(f)
-                        self.saved_decks_combo.addItem(deck_data.get('name', file[:-5]), file)
-                    except Exception as e:
-                        print(f"读取卡组文件失败: {deck_file} - {e}")
-        
-        # 同时刷新MyDeckPage中的卡组列表
-        if hasattr(self.parent, 'my_deck_page'):
-            self.parent.my_deck_page.refresh_saved_decks()
-    
-    def load_saved_deck(self, index):
-        """加载选中的已保存卡组"""
-        deck_file = self.saved_decks_combo.itemData(index)
-        if not deck_file:
-            return
-        
-        try:
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            deck_path = os.path.join(decks_dir, deck_file)
-            
-            with open(deck_path, 'r', encoding='utf-8') as f:
-                deck_data = json.load(f)
-            
-            # 清空当前选择
-            self.selected_cards = []
-            
-            # 添加卡组中的卡片
-            for card_file in deck_data.get('cards', []):
-                self.selected_cards.append(card_file)
-            
-            # 刷新显示
-            self.display_page(self.current_page)
-            
-            QMessageBox.information(self, "成功", f"已加载卡组 '{deck_data.get('name')}'")
-            self.parent.log_output.append(f"[卡组] 已加载卡组 '{deck_data.get('name')}'")
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"加载卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 加载卡组失败: {str(e)}")
-
-class MyDeckPage(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.parent = parent
-        self.card_size = QSize(100, 140)  # 标准卡片尺寸
-        self.cards_per_row = 4
-        self.init_ui()
-    
-    def init_ui(self):
-        main_layout = QVBoxLayout(self)
-        main_layout.setSpacing(15)
+        # 卡片列表的样式在页面级设置，只解析一次
+        self.setStyleSheet(self.PAGE_STYLE)
         
         # 标题
         title_label = QLabel("我的卡组")
@@ -1275,26 +1791,32 @@ class MyDeckPage(QWidget):
         # 刷新已保存卡组列表
         self.refresh_saved_decks()
         
-        # 卡片显示区域
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_content = QWidget()
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setAlignment(Qt.AlignTop)
-        self.scroll_area.setWidget(self.scroll_content)
-        
-        # 设置滚动区域样式
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QWidget#ScrollContent {
-                background-color: transparent;
-            }
-        """)
-        self.scroll_content.setObjectName("ScrollContent")
-        main_layout.addWidget(self.scroll_area)
+        # 卡片显示区域：图标模式的列表视图，由模型提供卡片图片与名称
+        self.card_model = QStandardItemModel(self)
+        self.card_view = QListView()
+        self.card_view.setObjectName("DeckCardView")
+        self.card_view.setViewMode(QListView.IconMode)
+        self.card_view.setFlow(QListView.LeftToRight)
+        self.card_view.setWrapping(True)
+        self.card_view.setResizeMode(QListView.Adjust)
+        self.card_view.setMovement(QListView.Static)
+        self.card_view.setUniformItemSizes(True)
+        self.card_view.setWordWrap(True)
+        self.card_view.setIconSize(self.card_size)
+        self.card_view.setGridSize(QSize(self.card_size.width() + 20, self.card_size.height() + 50))
+        self.card_view.setSpacing(5)
+        self.card_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.card_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.card_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.card_view.customContextMenuRequested.connect(self.on_card_context_menu)
+        self.card_view.setModel(self.card_model)
+        main_layout.addWidget(self.card_view)
+        
+        self.empty_label = QLabel("卡组为空，请添加卡片")
+        self.empty_label.setStyleSheet("color: #FF8888; font-size: 14px;")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.hide()
+        main_layout.addWidget(self.empty_label)
         
         # 操作按钮
         btn_layout = QHBoxLayout()
@@ -1323,256 +1845,64 @@ class MyDeckPage(QWidget):
             QMessageBox.warning(self, "警告", "请输入卡组名称！")
             return
         
-        # 获取当前卡组中的卡片
-        card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-        if not os.path.exists(card_dir):
-            QMessageBox.warning(self, "警告", "当前卡组为空！")
-            return
-        
-        card_files = [f for f in os.listdir(card_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+        # 获取当前卡组中的卡片：优先使用 load_deck 记录的列表，尚未加载时才扫描目录
+        if self.current_deck_cards is not None:
+            card_files = list(self.current_deck_cards)
+        else:
+            card_dir = CARD_DIR
+            card_files = list_card_files(card_dir) if os.path.exists(card_dir) else []
         if not card_files:
             QMessageBox.warning(self, "警告", "当前卡组为空！")
             return
         
-        try:
-            # 创建保存卡组的目录
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            os.makedirs(decks_dir, exist_ok=True)
-            
-            # 构建卡组数据
-            deck_data = {
-                "name": deck_name,
-                "cards": card_files,
-                "timestamp": int(time.time())
-            }
-            
-            # 保存到文件
-            deck_file = os.path.join(decks_dir, f"{deck_name}.json")
-            with open(deck_file, 'w', encoding='utf-8') as f:
-                json.dump(deck_data, f, ensure_ascii=False, indent=2)
-            
-            QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已保存！")
-            self.parent.log_output.append(f"[卡组] 已保存卡组 '{deck_name}'")
-            
+        if self._write_saved_deck(deck_name, card_files):
             # 清空输入框
             self.save_deck_name.clear()
-            
-            # 刷新已保存卡组列表
-            self.refresh_saved_decks()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"保存卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 保存卡组失败: {str(e)}")
 
-    def refresh_saved_decks(self):
-        """刷新已保存卡组列表"""
-        if hasattr(self, 'saved_decks_combo'):
-            self.saved_decks_combo.clear()
-            self.saved_decks_combo.addItem("选择卡组", None)
-            
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            if os.path.exists(decks_dir):
-                for file in os.listdir(decks_dir):
-                    if file.endswith('.json'):
-                        deck_file = os.path.join(decks_dir, file)
-                        try:
-                            with open(deck_file, 'r', encoding='utf-8') as f:
-                                deck_data = json.load(f)
-                            self.saved_decks_combo.addItem(deck_data.get('name', file[:-5]), file)
-                        except Exception as e:
-                            print(f"读取卡组文件失败: {deck_file} - {e}")
-            
-        # 同时刷新CardSelectPage中的卡组列表
-        if hasattr(self.parent, 'card_select_page'):
-            self.parent.card_select_page.refresh_saved_decks()
-            
-    def load_selected_deck(self):
-        """加载选中的已保存卡组"""
-        deck_file = self.saved_decks_combo.itemData(self.saved_decks_combo.currentIndex())
-        if not deck_file:
-            QMessageBox.warning(self, "警告", "请选择要加载的卡组！")
-            return
-        
-        try:
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            deck_path = os.path.join(decks_dir, deck_file)
-            
-            with open(deck_path, 'r', encoding='utf-8') as f:
-                deck_data = json.load(f)
-            
-            # 清空当前卡组
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-            for file in os.listdir(card_dir):
-                file_path = os.path.join(card_dir, file)
-                try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                except Exception as e:
-                    print(f"删除文件失败: {file_path} - {e}")
-            
-            # 复制卡片到当前卡组
-            source_dir = os.path.join(get_exe_dir(), "quanka")
-            success_count = 0
-            for card_file in deck_data.get('cards', []):
-                # 查找卡片在quanka目录中的路径
-                src = None
-                for root, _, files in os.walk(source_dir):
-                    if card_file in files:
-                        src = os.path.join(root, card_file)
-                        break
-                
-                if src and os.path.exists(src):
-                    dst = os.path.join(card_dir, card_file)
-                    try:
-                        shutil.copy2(src, dst)
-                        success_count += 1
-                    except Exception as e:
-                        print(f"复制文件失败: {src} -> {dst} - {e}")
-            
-            if success_count > 0:
-                # 重新加载卡组显示
-                self.load_deck()
-                
-                QMessageBox.information(self, "成功", f"已加载卡组 '{deck_data.get('name')}'，共 {success_count} 张卡片")
-                self.parent.log_output.append(f"[卡组] 已加载卡组 '{deck_data.get('name')}'")
-                
-                # 刷新卡牌优先级页面（已迁移）
-                if hasattr(self.parent, 'card_priority_page'):
-                    self.parent.card_priority_page.refresh_card_priority()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"加载卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 加载卡组失败: {str(e)}")
-            
-    def delete_selected_deck(self):
-        """删除选中的已保存卡组"""
-        deck_file = self.saved_decks_combo.itemData(self.saved_decks_combo.currentIndex())
-        deck_name = self.saved_decks_combo.currentText()
-        
-        if not deck_file:
-            QMessageBox.warning(self, "警告", "请选择要删除的卡组！")
-            return
-        
-        reply = QMessageBox.question(
-            self, '确认删除',
-            f'确定要删除卡组 "{deck_name}" 吗？此操作不可撤销！',
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-                deck_path = os.path.join(decks_dir, deck_file)
-                
-                if os.path.exists(deck_path):
-                    os.remove(deck_path)
-                    
-                    QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已删除！")
-                    self.parent.log_output.append(f"[卡组] 已删除卡组 '{deck_name}'")
-                    
-                    # 刷新已保存卡组列表
-                    self.refresh_saved_decks()
-                    
-            except Exception as e:
-                QMessageBox.warning(self, "错误", f"删除卡组失败: {str(e)}")
-                self.parent.log_output.append(f"[卡组] 删除卡组失败: {str(e)}")
-                
     def load_deck(self):
         """加载当前卡组"""
         # 清空现有内容
-        for i in reversed(range(self.grid_layout.count())): 
-            if widget := self.grid_layout.itemAt(i).widget():
-                widget.deleteLater()
+        self.card_model.clear()
+        self.current_deck_cards = []
         
         # 获取卡组目录
-        card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
+        card_dir = CARD_DIR
         if not os.path.exists(card_dir):
-            no_card_label = QLabel("卡组为空，请添加卡片")
-            no_card_label.setStyleSheet("color: #FF8888; font-size: 14px;")
-            no_card_label.setAlignment(Qt.AlignCenter)
-            self.grid_layout.addWidget(no_card_label, 0, 0)
+            self.empty_label.show()
             return
         
-        # 获取所有卡片文件
-        card_files = [f for f in os.listdir(card_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+        # 获取所有卡片文件 (文件名, 完整路径)
+        with os.scandir(card_dir) as entries:
+            card_files = [(e.name, e.path) for e in entries
+                          if is_card_image(e.name) and e.is_file()]
         
         if not card_files:
-            no_card_label = QLabel("卡组为空，请添加卡片")
-            no_card_label.setStyleSheet("color: #FF8888; font-size: 14px;")
-            no_card_label.setAlignment(Qt.AlignCenter)
-            self.grid_layout.addWidget(no_card_label, 0, 0)
+            self.empty_label.show()
             return
+        self.empty_label.hide()
+        self.current_deck_cards = [card_file for card_file, _ in card_files]
         
         # 刷新已保存卡组列表
         self.refresh_saved_decks()
         
-        # 添加卡片
-        row, col = 0, 0
-        for card_file in card_files:
-            card_path = os.path.join(card_dir, card_file)
-            
-            # 创建卡片容器
-            card_container = QWidget()
-            card_container.setStyleSheet("""
-                background-color: rgba(60, 60, 90, 150);
-                border-radius: 10px;
-            """)
-            card_layout = QVBoxLayout(card_container)
-            card_layout.setAlignment(Qt.AlignCenter)
-            card_layout.setSpacing(5)
-            card_layout.setContentsMargins(5, 5, 5, 5)
-            
-            # 卡片图片
-            card_label = QLabel()
-            pixmap = QPixmap(card_path)
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(self.card_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                card_label.setPixmap(pixmap)
-            card_label.setAlignment(Qt.AlignCenter)
-            card_label.setContextMenuPolicy(Qt.CustomContextMenu)
-            card_label.customContextMenuRequested.connect(lambda pos, f=card_file: self.show_context_menu(pos, f))
-            
-            # 卡片名称
+        # 添加卡片：每张卡片一个模型项（图片 + 名称），由视图统一绘制
+        for card_file, card_path in card_files:
             card_name = card_file.split('_', 1)[-1].rsplit('.', 1)[0]
-            name_label = QLabel(card_name)
-            name_label.setStyleSheet("""
-                QLabel {
-                    color: #FFFFFF;
-                    background-color: transparent;
-                    font-weight: bold;
-                    font-size: 12px;
-                    padding: 2px;
-                    max-width: %dpx;
-                }
-            """ % (self.card_size.width() - 10))
-            name_label.setAlignment(Qt.AlignCenter)
-            name_label.setWordWrap(True)
-            
-            card_layout.addWidget(card_label)
-            card_layout.addWidget(name_label)
-            self.grid_layout.addWidget(card_container, row, col)
-            
-            col += 1
-            if col >= self.cards_per_row:
-                col = 0
-                row += 1
+            item = QStandardItem(card_name)
+            pixmap = load_card_pixmap(card_path, self.card_size.width(), self.card_size.height())
+            if not pixmap.isNull():
+                item.setIcon(QIcon(pixmap))
+            item.setData(card_file, self.CARD_FILE_ROLE)
+            item.setTextAlignment(Qt.AlignCenter)
+            item.setEditable(False)
+            self.card_model.appendRow(item)
     
-    def refresh_saved_decks(self):
-        """刷新已保存卡组列表"""
-        self.saved_decks_combo.clear()
-        self.saved_decks_combo.addItem("选择卡组", None)
-        
-        decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-        if os.path.exists(decks_dir):
-            for file in os.listdir(decks_dir):
-                if file.endswith('.json'):
-                    deck_file = os.path.join(decks_dir, file)
-                    try:
-                        with open(deck_file, 'r', encoding='utf-8') as f:
-                            deck_data = json.load(f)
-                        self.saved_decks_combo.addItem(deck_data.get('name', file[:-5]), file)
-                    except Exception as e:
-                        print(f"读取卡组文件失败: {deck_file} - {e}")
+    def on_card_context_menu(self, pos):
+        """卡片列表右键：定位到点击的卡片"""
+        index = self.card_view.indexAt(pos)
+        if index.isValid():
+            card_file = index.data(self.CARD_FILE_ROLE)
+            self.show_context_menu(self.card_view.viewport().mapToGlobal(pos), card_file)
     
     def load_selected_deck(self):
         """加载选中的已保存卡组"""
@@ -1582,91 +1912,41 @@ class MyDeckPage(QWidget):
             return
         
         try:
-            decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-            deck_path = os.path.join(decks_dir, deck_file)
-            
-            with open(deck_path, 'r', encoding='utf-8') as f:
-                deck_data = json.load(f)
-            
-            # 清空当前卡组
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-            for file in os.listdir(card_dir):
-                file_path = os.path.join(card_dir, file)
-                try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                except Exception as e:
-                    print(f"删除文件失败: {file_path} - {e}")
-            
-            # 复制卡片到当前卡组
-            import shutil
-            source_dir = os.path.join(get_exe_dir(), "quanka")
-            success_count = 0
-            for card_file in deck_data.get('cards', []):
-                # 查找卡片在quanka目录中的路径
-                src = None
-                for root, _, files in os.walk(source_dir):
-                    if card_file in files:
-                        src = os.path.join(root, card_file)
-                        break
-                
-                if src and os.path.exists(src):
-                    dst = os.path.join(card_dir, card_file)
-                    try:
-                        shutil.copy2(src, dst)
-                        success_count += 1
-                    except Exception as e:
-                        print(f"复制文件失败: {src} -> {dst} - {e}")
-            
-            if success_count > 0:
-                # 重新加载卡组显示
-                self.load_deck()
-                
-                QMessageBox.information(self, "成功", f"已加载卡组 '{deck_data.get('name')}'，共 {success_count} 张卡片")
-                self.parent.log_output.append(f"[卡组] 已加载卡组 '{deck_data.get('name')}'")
-                
-                # 刷新卡牌优先级页面（已迁移）
-                if hasattr(self.parent, 'card_priority_page'):
-                    self.parent.card_priority_page.refresh_card_priority()
-            
+            deck_data = self._read_saved_deck(deck_file)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"加载卡组失败: {str(e)}")
-            self.parent.log_output.append(f"[卡组] 加载卡组失败: {str(e)}")
-    
-    def delete_selected_deck(self):
-        """删除选中的已保存卡组"""
-        deck_file = self.saved_decks_combo.itemData(self.saved_decks_combo.currentIndex())
-        deck_name = self.saved_decks_combo.currentText()
-        
-        if not deck_file:
-            QMessageBox.warning(self, "警告", "请选择要删除的卡组！")
-            return
-        
-        reply = QMessageBox.question(
-            self, '确认删除',
-            f'确定要删除卡组 "{deck_name}" 吗？此操作不可撤销！',
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-        )
+            self.parent.append_log(f"[卡组] 加载卡组失败: {str(e)}")
+            return
         
-        if reply == QMessageBox.Yes:
-            try:
-                decks_dir = os.path.join(get_exe_dir(), "saved_decks")
-                deck_path = os.path.join(decks_dir, deck_file)
-                
-                if os.path.exists(deck_path):
-                    os.remove(deck_path)
-                    
-                    QMessageBox.information(self, "成功", f"卡组 '{deck_name}' 已删除！")
-                    self.parent.log_output.append(f"[卡组] 已删除卡组 '{deck_name}'")
-                    
-                    # 刷新已保存卡组列表
-                    self.refresh_saved_decks()
-                    
-            except Exception as e:
-                QMessageBox.warning(self, "错误", f"删除卡组失败: {str(e)}")
-                self.parent.log_output.append(f"[卡组] 删除卡组失败: {str(e)}")
+        # 清空当前卡组并复制卡片（在线程池中执行）
+        card_dir = CARD_DIR
+        quanka_index = get_quanka_index()
+        pairs = []
+        for card_file in deck_data.get('cards', []):
+            # 查找卡片在quanka目录中的路径
+            src = quanka_index.get(card_file)
+            if src:
+                pairs.append((src, os.path.join(card_dir, card_file)))
+        
+        self.load_deck_btn.setEnabled(False)
+        deck_name = deck_data.get('name')
+        start_deck_io(self, card_dir, pairs, lambda count: self.on_deck_loaded(deck_name, count))
+    
+    def on_deck_loaded(self, deck_name, success_count):
+        """卡组文件复制完成后的回调"""
+        self.load_deck_btn.setEnabled(True)
+        if success_count > 0:
+            # 重新加载卡组显示
+            self.load_deck()
+            
+            QMessageBox.information(self, "成功", f"已加载卡组 '{deck_name}'，共 {success_count} 张卡片")
+            self.parent.append_log(f"[卡组] 已加载卡组 '{deck_name}'")
+            
+            # 刷新卡牌优先级页面（已迁移）
+            if hasattr(self.parent, 'card_priority_page'):
+                self.parent.card_priority_page.refresh_card_priority()
     
-    def show_context_menu(self, pos, card_file):
+    def show_context_menu(self, global_pos, card_file):
         """显示右键菜单"""
         menu = QMenu(self)
         
@@ -1674,22 +1954,21 @@ class MyDeckPage(QWidget):
         remove_action.triggered.connect(lambda: self.remove_card(card_file))
         
         menu.addAction(remove_action)
-        menu.exec_(self.sender().mapToGlobal(pos))
+        menu.exec_(global_pos)
     
     def remove_card(self, card_file):
         """移除指定卡片"""
-        card_path = os.path.join(get_exe_dir(), "shadowverse_cards_cost", card_file)
-        if os.path.exists(card_path):
-            try:
-                os.remove(card_path)
+        card_path = os.path.join(CARD_DIR, card_file)
+        try:
+            if _safe_unlink(card_path):
                 self.load_deck()  # 重新加载卡组
-                self.parent.log_output.append(f"[卡组] 已移除卡片: {card_file}")
+                self.parent.append_log(f"[卡组] 已移除卡片: {card_file}")
                 
                 # 刷新卡牌优先级页面（已迁移）
                 if hasattr(self.parent, 'card_priority_page'):
                     self.parent.card_priority_page.refresh_card_priority()
-            except Exception as e:
-                QMessageBox.warning(self, "错误", f"移除卡片失败: {str(e)}")
+        except Exception as e:
+            QMessageBox.warning(self, "错误", f"移除卡片失败: {str(e)}")
     
     def add_cards(self):
         """添加更多卡片"""
@@ -1705,30 +1984,48 @@ class MyDeckPage(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
+            card_dir = CARD_DIR
             if os.path.exists(card_dir):
                 # 删除所有卡片文件
-                for file in os.listdir(card_dir):
-                    file_path = os.path.join(card_dir, file)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.unlink(file_path)
-                    except Exception as e:
-                        print(f"删除文件失败: {file_path} - {e}")
+                _reset_deck_dir(card_dir)
                 
                 self.load_deck()  # 重新加载卡组
-                self.parent.log_output.append("[卡组] 已清空所有卡片")
+                self.parent.append_log("[卡组] 已清空所有卡片")
                 
                 # 刷新卡牌优先级页面（已迁移）
                 if hasattr(self.parent, 'card_priority_page'):
                     self.parent.card_priority_page.refresh_card_priority()
 
 class CardPriorityPage(QWidget):
+    PAGE_STYLE = """
+        QTableView#PriorityTable {
+            background-color: transparent;
+            border: none;
+            color: #FFFFFF;
+            gridline-color: rgba(100, 100, 150, 120);
+        }
+        QTableView#PriorityTable::item {
+            background-color: rgba(60, 60, 90, 150);
+        }
+        QTableView#PriorityTable QLineEdit {
+            background-color: rgba(80, 80, 120, 180);
+            color: white;
+        }
+        QHeaderView::section {
+            background-color: rgba(60, 60, 90, 200);
+            color: #AACCFF;
+            border: none;
+            padding: 4px;
+        }
+    """
+    CARD_FILE_ROLE = Qt.UserRole + 1  # 名称列中保存卡片文件名的角色
+    # 表格列：缩略图、卡名、出牌优先级、进化优先级
+    ICON_COLUMN, NAME_COLUMN, PLAY_COLUMN, EVOLVE_COLUMN = range(4)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.config_data = self.load_config()
-        self.card_widgets = []
         self.init_ui()
 
     def init_ui(self):
@@ -1736,6 +2033,9 @@ class CardPriorityPage(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(15)
 
+        # 表格样式在页面级设置，只解析一次
+        self.setStyleSheet(self.PAGE_STYLE)
+
         title_label = QLabel("卡牌优先级")
         title_label.setStyleSheet("font-size: 20px; color: #88AAFF; font-weight: bold;")
         title_label.setAlignment(Qt.AlignCenter)
@@ -1745,26 +2045,33 @@ class CardPriorityPage(QWidget):
         desc_label.setStyleSheet("font-size: 12px; color: #AACCFF;")
         main_layout.addWidget(desc_label)
 
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_area.setWidget(self.scroll_content)
-        self.scroll_content.setObjectName("ScrollContent")
-        main_layout.addWidget(self.scroll_area)
-
-        # 设置滚动区域样式与主窗口一致
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QWidget#ScrollContent {
-                background-color: transparent;
-            }
-        """)
-        self.scroll_content.setObjectName("ScrollContent")
-        main_layout.addWidget(self.scroll_area)
+        self._empty_label = QLabel()
+        self._empty_label.setStyleSheet("color: #FF8888; font-size: 14px;")
+        self._empty_label.setAlignment(Qt.AlignCenter)
+        self._empty_label.hide()
+        main_layout.addWidget(self._empty_label)
+
+        # 所有卡片放在同一个模型中，由表格委托统一绘制，编辑时才创建输入框
+        self.priority_model = QStandardItemModel(0, 4, self)
+        self.priority_model.setHorizontalHeaderLabels(["", "卡牌", "出牌优先级", "进化优先级"])
+        self.priority_view = QTableView()
+        self.priority_view.setObjectName("PriorityTable")
+        self.priority_view.setModel(self.priority_model)
+        self.priority_view.setIconSize(QSize(80, 120))
+        self.priority_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.priority_view.setEditTriggers(
+            QAbstractItemView.CurrentChanged | QAbstractItemView.DoubleClicked | QAbstractItemView.AnyKeyPressed
+        )
+        self.priority_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.priority_view.verticalHeader().hide()
+        self.priority_view.verticalHeader().setDefaultSectionSize(130)
+        header = self.priority_view.horizontalHeader()
+        header.setSectionResizeMode(self.ICON_COLUMN, QHeaderView.Fixed)
+        header.resizeSection(self.ICON_COLUMN, 90)
+        header.setSectionResizeMode(self.NAME_COLUMN, QHeaderView.Stretch)
+        header.setSectionResizeMode(self.PLAY_COLUMN, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(self.EVOLVE_COLUMN, QHeaderView.ResizeToContents)
+        main_layout.addWidget(self.priority_view)
 
         btn_layout = QHBoxLayout()
         self.save_btn = QPushButton("保存优先级")
@@ -1780,119 +2087,93 @@ class CardPriorityPage(QWidget):
         self.load_card_priority_settings()
 
     def load_config(self):
-        config_path = os.path.join(get_exe_dir(), "config.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        # 配置总是整体原子写入，不会读到写了一半的文件；只需处理无法读取或被手工改坏的情况
+        try:
+            return read_config_cached(CONFIG_PATH)
+        except (OSError, ValueError):
+            return {}
 
     def load_card_priority_settings(self):
-        # 清空现有内容
-        for i in reversed(range(self.scroll_layout.count())):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        self.card_widgets = []
-
-        card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
+        """按卡组目录增量更新：只删除被移除卡片的行、只为新增卡片建行，已有行的输入保持不变"""
+        card_dir = CARD_DIR
         if not os.path.exists(card_dir):
-            no_card_label = QLabel("未找到卡组卡片，请先在'卡组选择'页面选择卡片")
-            no_card_label.setStyleSheet("color: #FF8888; font-size: 14px;")
-            no_card_label.setAlignment(Qt.AlignCenter)
-            self.scroll_layout.addWidget(no_card_label)
-            return
-
-        card_files = [f for f in os.listdir(card_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-        if not card_files:
-            no_card_label = QLabel("没有找到卡片，请先在'卡组选择'页面选择卡片")
-            no_card_label.setStyleSheet("color: #FF8888; font-size: 14px;")
-            no_card_label.setAlignment(Qt.AlignCenter)
-            self.scroll_layout.addWidget(no_card_label)
-            return
+            card_files = []
+            empty_text = "未找到卡组卡片，请先在'卡组选择'页面选择卡片"
+        else:
+            card_files = list_card_files(card_dir)
+            empty_text = "没有找到卡片，请先在'卡组选择'页面选择卡片"
+
+        # 从后往前移除已不在卡组中的行，避免行号错位
+        current = set(card_files)
+        existing = set()
+        for row in range(self.priority_model.rowCount() - 1, -1, -1):
+            card_file = self.priority_model.item(row, self.NAME_COLUMN).data(self.CARD_FILE_ROLE)
+            if card_file in current:
+                existing.add(card_file)
+            else:
+                self.priority_model.removeRow(row)
 
+        # 为新增的卡片追加行
+        high_priority_cards = self.config_data.get("high_priority_cards", {})
+        evolve_priority_cards = self.config_data.get("evolve_priority_cards", {})
         for card_file in card_files:
-            card_name = card_file.split('_', 1)[-1].rsplit('.', 1)[0]
-            card_row = QWidget()
-            card_row.setStyleSheet("background-color: rgba(60, 60, 90, 150); border-radius: 10px;")
-            row_layout = QHBoxLayout(card_row)
-            row_layout.setContentsMargins(10, 5, 10, 5)
-
-            card_label = QLabel()
-            card_path = os.path.join(get_exe_dir(), "shadowverse_cards_cost", card_file)
-            pixmap = QPixmap(card_path)
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(80, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                card_label.setPixmap(pixmap)
-            card_label.setAlignment(Qt.AlignCenter)
-            row_layout.addWidget(card_label)
-
-            name_label = QLabel(card_name)
-            name_label.setStyleSheet("color: #FFFFFF; font-weight: bold; min-width: 120px;")
-            name_label.setAlignment(Qt.AlignCenter)
-            row_layout.addWidget(name_label)
-
-            row_layout.addWidget(QLabel("出牌优先级:"))
-            play_priority_input = QLineEdit()
-            play_priority_input.setStyleSheet("background-color: rgba(80, 80, 120, 180); color: white;")
-            play_priority_input.setMaximumWidth(50)
-            high_priority = self.config_data.get("high_priority_cards", {}).get(card_name, {})
-            if high_priority:
-                play_priority_input.setText(str(high_priority.get("priority", "")))
-            row_layout.addWidget(play_priority_input)
-
-            row_layout.addWidget(QLabel("进化优先级:"))
-            evolve_priority_input = QLineEdit()
-            evolve_priority_input.setStyleSheet("background-color: rgba(80, 80, 120, 180); color: white;")
-            evolve_priority_input.setMaximumWidth(50)
-            evolve_priority = self.config_data.get("evolve_priority_cards", {}).get(card_name, {})
-            if evolve_priority:
-                evolve_priority_input.setText(str(evolve_priority.get("priority", "")))
-            row_layout.addWidget(evolve_priority_input)
-
-            self.card_widgets.append({
-                "card_name": card_name,
-                "play_priority": play_priority_input,
-                "evolve_priority": evolve_priority_input
-            })
-
-            self.scroll_layout.addWidget(card_row)
-
-        self.scroll_layout.addStretch()
+            if card_file not in existing:
+                self.priority_model.appendRow(
+                    self._create_card_priority_row(card_file, high_priority_cards, evolve_priority_cards)
+                )
+
+        self._empty_label.setText(empty_text)
+        self._empty_label.setVisible(not card_files)
+        self.priority_view.setVisible(bool(card_files))
+
+    def _create_card_priority_row(self, card_file, high_priority_cards, evolve_priority_cards):
+        card_name = card_file.split('_', 1)[-1].rsplit('.', 1)[0]
+
+        icon_item = QStandardItem()
+        icon_item.setEditable(False)
+        pixmap = load_card_pixmap(os.path.join(CARD_DIR, card_file), 80, 120)
+        if not pixmap.isNull():
+            icon_item.setData(pixmap, Qt.DecorationRole)
+
+        name_item = QStandardItem(card_name)
+        name_item.setEditable(False)
+        name_item.setData(card_file, self.CARD_FILE_ROLE)
+        name_item.setTextAlignment(Qt.AlignCenter)
+
+        high_priority = high_priority_cards.get(card_name, {})
+        play_item = QStandardItem(str(high_priority.get("priority", "")) if high_priority else "")
+        play_item.setTextAlignment(Qt.AlignCenter)
+
+        evolve_priority = evolve_priority_cards.get(card_name, {})
+        evolve_item = QStandardItem(str(evolve_priority.get("priority", "")) if evolve_priority else "")
+        evolve_item.setTextAlignment(Qt.AlignCenter)
+
+        return [icon_item, name_item, play_item, evolve_item]
+
+    def _iter_priority_rows(self):
+        """逐行产出 (卡名, 出牌优先级文本, 进化优先级文本)，文本已去除首尾空白"""
+        model = self.priority_model
+        for row in range(model.rowCount()):
+            yield (
+                model.item(row, self.NAME_COLUMN).text(),
+                model.item(row, self.PLAY_COLUMN).text().strip(),
+                model.item(row, self.EVOLVE_COLUMN).text().strip(),
+            )
 
     def refresh_card_priority(self):
-        current_settings = {}
-        for card in self.card_widgets:
-            play_priority = card["play_priority"].text().strip()
-            evolve_priority = card["evolve_priority"].text().strip()
-            current_settings[card["card_name"]] = {"play": play_priority, "evolve": evolve_priority}
-
+        # 增量更新，已有卡片行保留当前输入，无需保存/恢复
         self.load_card_priority_settings()
 
-        for card in self.card_widgets:
-            card_name = card["card_name"]
-            if card_name in current_settings:
-                settings = current_settings[card_name]
-                if settings["play"]:
-                    card["play_priority"].setText(settings["play"])
-                if settings["evolve"]:
-                    card["evolve_priority"].setText(settings["evolve"]) 
-
     def get_current_config(self):
         high_priority_cards = {}
         evolve_priority_cards = {}
-        for card in self.card_widgets:
-            card_name = card["card_name"]
-            play_priority_text = card["play_priority"].text().strip()
+        for card_name, play_priority_text, evolve_priority_text in self._iter_priority_rows():
             if play_priority_text:
                 try:
                     priority = int(play_priority_text)
                     high_priority_cards[card_name] = {"priority": priority}
                 except Exception:
                     pass
-            evolve_priority_text = card["evolve_priority"].text().strip()
             if evolve_priority_text:
                 try:
                     priority = int(evolve_priority_text)
@@ -1906,58 +2187,56 @@ class CardPriorityPage(QWidget):
             result["evolve_priority_cards"] = evolve_priority_cards
         return result
 
+    @staticmethod
+    def _priority_error(text):
+        """校验优先级输入（已去除首尾空白）：合法返回 None，否则返回错误说明"""
+        if not text.isdecimal():
+            return "请输入0-999之间的整数"
+        if int(text) > 999:
+            return "优先级必须在0-999之间"
+        return None
+
     def save_config(self):
         # 仅保存卡牌优先级部分，合并磁盘上的其余配置
         high_priority_cards = {}
         evolve_priority_cards = {}
-        for card in self.card_widgets:
-            card_name = card["card_name"]
-            play_priority_text = card["play_priority"].text().strip()
+        for card_name, play_priority_text, evolve_priority_text in self._iter_priority_rows():
             if play_priority_text:
-                try:
-                    priority = int(play_priority_text)
-                    if priority < 0 or priority > 999:
-                        raise ValueError("优先级必须在0-999之间")
-                    high_priority_cards[card_name] = {"priority": priority}
-                except Exception as e:
-                    QMessageBox.warning(self, "输入错误", f"卡片 '{card_name}' 的出牌优先级设置错误: {str(e)}")
+                error = self._priority_error(play_priority_text)
+                if error:
+                    QMessageBox.warning(self, "输入错误", f"卡片 '{card_name}' 的出牌优先级设置错误: {error}")
                     return
-            evolve_priority_text = card["evolve_priority"].text().strip()
+                high_priority_cards[card_name] = {"priority": int(play_priority_text)}
             if evolve_priority_text:
-                try:
-                    priority = int(evolve_priority_text)
-                    if priority < 0 or priority > 999:
-                        raise ValueError("优先级必须在0-999之间")
-                    evolve_priority_cards[card_name] = {"priority": priority}
-                except Exception as e:
-                    QMessageBox.warning(self, "输入错误", f"卡片 '{card_name}' 的进化优先级设置错误: {str(e)}")
+                error = self._priority_error(evolve_priority_text)
+                if error:
+                    QMessageBox.warning(self, "输入错误", f"卡片 '{card_name}' 的进化优先级设置错误: {error}")
                     return
+                evolve_priority_cards[card_name] = {"priority": int(evolve_priority_text)}
 
-        config_path = os.path.join(get_exe_dir(), "config.json")
-        existing = {}
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    existing = json.load(f)
-            except Exception:
-                existing = {}
+        config_path = CONFIG_PATH
+        try:
+            with CONFIG_WRITE_LOCK:
+                try:
+                    existing = read_config_cached(config_path)
+                except Exception:
+                    existing = {}
 
-        if high_priority_cards:
-            existing["high_priority_cards"] = high_priority_cards
-        elif "high_priority_cards" in existing:
-            del existing["high_priority_cards"]
+                if high_priority_cards:
+                    existing["high_priority_cards"] = high_priority_cards
+                elif "high_priority_cards" in existing:
+                    del existing["high_priority_cards"]
 
-        if evolve_priority_cards:
-            existing["evolve_priority_cards"] = evolve_priority_cards
-        elif "evolve_priority_cards" in existing:
-            del existing["evolve_priority_cards"]
+                if evolve_priority_cards:
+                    existing["evolve_priority_cards"] = evolve_priority_cards
+                elif "evolve_priority_cards" in existing:
+                    del existing["evolve_priority_cards"]
 
-        try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(existing, f, indent=4, ensure_ascii=False)
+                write_config_atomic(config_path, existing)
+            self.config_data = existing
             QMessageBox.information(self, "成功", "卡牌优先级已保存！")
             if hasattr(self.parent, 'log_output'):
-                self.parent.log_output.append("[配置] 卡牌优先级已更新")
+                self.parent.append_log("[配置] 卡牌优先级已更新")
         except Exception as e:
             QMessageBox.warning(self, "保存失败", f"保存卡牌优先级失败: {str(e)}")
 
@@ -2029,19 +2308,15 @@ class SharePage(QWidget):
         try:
             # 获取当前卡组和配置
             card_files = []
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
+            card_dir = CARD_DIR
             if os.path.exists(card_dir):
-                card_files = [f for f in os.listdir(card_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+                card_files = list_card_files(card_dir)
             
             # 读取磁盘上的完整配置（包含参数设置与卡牌优先级）以确保分享码包含完整内容
-            config_path = os.path.join(get_exe_dir(), "config.json")
-            config_data = {}
-            if os.path.exists(config_path):
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        config_data = json.load(f)
-                except Exception:
-                    config_data = {}
+            try:
+                config_data = read_config_cached(CONFIG_PATH)
+            except Exception:
+                config_data = {}
             
             # 创建分享数据
             share_data = {
@@ -2052,25 +2327,24 @@ class SharePage(QWidget):
             }
             
             # 转换为JSON并压缩
-            json_data = json.dumps(share_data, ensure_ascii=False)
-            compressed = zlib.compress(json_data.encode('utf-8'))
+            compressed = compress_share_payload(json_dumps_bytes(share_data))
             
-            # 转换为base64作为分享码
-            share_code = base64.b64encode(compressed).decode('ascii')
+            # 转换为Base85作为分享码
+            share_code = encode_share_code(compressed)
             
             self.share_code_output.setText(share_code)
-            self.parent.log_output.append("[分享] 分享码已生成")
+            self.parent.append_log("[分享] 分享码已生成")
             
         except Exception as e:
             QMessageBox.warning(self, "错误", f"生成分享码失败: {str(e)}")
-            self.parent.log_output.append(f"[分享] 生成分享码失败: {str(e)}")
+            self.parent.append_log(f"[分享] 生成分享码失败: {str(e)}")
     
     def copy_share_code(self):
         """复制分享码到剪贴板"""
         if self.share_code_output.text():
             clipboard = QApplication.clipboard()
             clipboard.setText(self.share_code_output.text())
-            self.parent.log_output.append("[分享] 分享码已复制到剪贴板")
+            self.parent.append_log("[分享] 分享码已复制到剪贴板")
             QMessageBox.information(self, "成功", "分享码已复制到剪贴板！")
     
     def apply_share_code(self):
@@ -2082,9 +2356,8 @@ class SharePage(QWidget):
         
         try:
             # 解码分享码
-            compressed = base64.b64decode(share_code.encode('ascii'))
-            json_data = zlib.decompress(compressed).decode('utf-8')
-            share_data = json.loads(json_data)
+            compressed = decode_share_code(share_code)
+            share_data = json_loads(decompress_share_payload(compressed))
             
             # 验证版本
             version = share_data.get("version", 1)
@@ -2092,40 +2365,29 @@ class SharePage(QWidget):
                 raise ValueError("不支持的分享码版本")
             
             # 应用卡组
-            card_dir = os.path.join(get_exe_dir(), "shadowverse_cards_cost")
-            os.makedirs(card_dir, exist_ok=True)
+            card_dir = CARD_DIR
             
             # 清空现有卡组
-            for f in os.listdir(card_dir):
-                os.remove(os.path.join(card_dir, f))
+            _reset_deck_dir(card_dir)
             
             # 复制卡片
-            source_dir = os.path.join(get_exe_dir(), "quanka")
+            source_dir = QUANKA_DIR
+            quanka_index = get_quanka_index()
+            pairs = []
             for card_file in share_data["cards"]:
-                # 支持旧版本和新版本的卡片路径
-                src = None
-                
-                # 尝试在根目录查找
+                # 支持旧版本和新版本的卡片路径：优先根目录，其次在分类结构索引中查找
                 root_path = os.path.join(source_dir, card_file)
-                if os.path.exists(root_path):
-                    src = root_path
-                else:
-                    # 在新版本分类结构中查找
-                    for root, dirs, files in os.walk(source_dir):
-                        if card_file in files:
-                            src = os.path.join(root, card_file)
-                            break
+                src = root_path if os.path.exists(root_path) else quanka_index.get(card_file)
                 
                 if src and os.path.exists(src):
-                    dst = os.path.join(card_dir, card_file)
-                    shutil.copy2(src, dst)
+                    pairs.append((src, os.path.join(card_dir, card_file)))
                 else:
-                    self.parent.log_output.append(f"[分享] 未找到卡片: {card_file}")
+                    self.parent.append_log(f"[分享] 未找到卡片: {card_file}")
+            place_card_files(pairs)
             
             # 应用配置
-            config_path = os.path.join(get_exe_dir(), "config.json")
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(share_data["config"], f, indent=4, ensure_ascii=False)
+            with CONFIG_WRITE_LOCK:
+                write_config_atomic(CONFIG_PATH, share_data["config"])
 
             # 刷新UI：更新参数设置页与卡牌优先级页
             if hasattr(self.parent, 'config_page'):
@@ -2138,33 +2400,64 @@ class SharePage(QWidget):
                 self.parent.my_deck_page.load_deck()
             
             QMessageBox.information(self, "成功", "卡组和配置已成功应用！")
-            self.parent.log_output.append(f"[分享] 已成功应用分享码中的卡组和配置")
+            self.parent.append_log(f"[分享] 已成功应用分享码中的卡组和配置")
             
         except Exception as e:
             QMessageBox.warning(self, "错误", f"应用分享码失败: {str(e)}")
-            self.parent.log_output.append(f"[分享] 应用分享码失败: {str(e)}")
+            self.parent.append_log(f"[分享] 应用分享码失败: {str(e)}")
+
+DEFAULT_ADB_SERIAL = "127.0.0.1:16384"  # 没有设备配置时的默认ADB端口
+LOG_MAX_BLOCKS = 5000  # 日志区域最多保留的行数
+LOG_FLUSH_INTERVAL_MS = 50  # 日志批量写入的间隔
 
 class ShadowverseUI(QMainWindow):
+    log_signal = pyqtSignal(str)  # 跨线程日志信号（排队连接到GUI线程）
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("影之诗自动对战脚本[完全免费]")
         self.setGeometry(100, 100, 900, 700)
+        
+        # 日志先缓冲，由单次定时器合并后一次性写入，减少文档重排次数；
+        # 日志不在屏幕上时继续留在缓冲区（最多保留 LOG_MAX_BLOCKS 条），回到主页面再写入
+        self._log_buffer = deque(maxlen=LOG_MAX_BLOCKS)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self.flush_logs)
+        
         self.setup_ui()
         
         self.script_thread = None
         self.run_time = 0
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.CoarseTimer)  # 秒级显示无需精确定时
         self.timer.timeout.connect(self.update_run_time)
+        self._last_run_time_text = "00:00:00"
         
         # 初始化状态
         self.current_turn = 0
         self.battle_count = 0
         self.turn_count = 0
         
-        # 日志监听器
-        self.log_listener = LogListener(self)
-        self.log_listener.log_signal.connect(self.append_log)
-        self.log_listener.start()
+        # 日志由产生方直接通过信号推送，无需轮询线程（在主脚本模块导入后注册）
+        self.log_signal.connect(self.append_log)
+        self._script_backend = None
+    
+    def ensure_script_backend(self):
+        """导入主脚本模块并注册日志推送（仅首次调用时执行）"""
+        if self._script_backend is None:
+            backend = _lazy_import_main()
+            backend.set_log_callback(self.log_signal.emit)
+            # 取出注册回调前已经进入队列的日志（不先判断 empty，直接取到 Empty 为止）
+            while True:
+                try:
+                    message = backend.log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.append_log(message)
+            self._script_backend = backend
+        return self._script_backend
     
     def setup_ui(self):
         # 主窗口设置
@@ -2176,118 +2469,7 @@ class ShadowverseUI(QMainWindow):
         # 主控件
         central_widget = QWidget()
         central_widget.setObjectName("CentralWidget")
-        central_widget.setStyleSheet("""
-            #CentralWidget {
-                background-color: rgba(30, 30, 40, 180);
-                border-radius: 15px;
-                padding: 15px;
-            }
-            QLabel {
-                color: #E0E0FF;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QLineEdit {
-                background-color: rgba(50, 50, 70, 200);
-                color: #FFFFFF;
-                border: 1px solid #5A5A8F;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QPushButton {
-                background-color: #4A4A7F;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-weight: bold;
-                min-width: 80px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #5A5A9F;
-            }
-            QPushButton:pressed {
-                background-color: #3A3A6F;
-            }
-            QTextEdit {
-                background-color: rgba(25, 25, 35, 220);
-                color: #66AAFF;
-                border: 1px solid #444477;
-                border-radius: 5px;
-            }
-            #StatsFrame {
-                background-color: rgba(40, 40, 60, 200);
-                border: 1px solid #555588;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            .StatLabel {
-                color: #AACCFF;
-                font-size: 12px;
-            }
-            .StatValue {
-                color: #FFFF88;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            #TitleLabel {
-                font-size: 20px;
-                color: #88AAFF;
-                font-weight: bold;
-                padding: 10px 0;
-            }
-            #WindowControlButton {
-                background: transparent;
-                border: none;
-                min-width: 30px;
-                max-width: 30px;
-                min-height: 30px;
-                max-height: 30px;
-                padding: 0;
-                margin: 0;
-            }
-            #WindowControlButton:hover {
-                background-color: rgba(255, 255, 255, 30);
-            }
-            #CloseButton:hover {
-                background-color: rgba(255, 0, 0, 100);
-            }
-            QGroupBox {
-                border: 1px solid #555588;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                font-size: 14px;
-                color: #88AAFF;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-            }
-            QComboBox {
-                background-color: rgba(80, 80, 120, 180);
-                color: white;
-                border: 1px solid #5A5A8F;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 12px;
-            }
-            QComboBox:hover {
-                background-color: rgba(90, 90, 140, 180);
-            }
-            QToolButton {
-                background: transparent;
-                border: none;
-                color: #88AAFF;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QToolButton:hover {
-                color: #AACCFF;
-            }
-        """)
+        central_widget.setStyleSheet(MAIN_STYLESHEET)
         
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(15)
@@ -2335,28 +2517,55 @@ class ShadowverseUI(QMainWindow):
         self.setup_main_page()
         self.stacked_widget.addWidget(self.main_page)
         
-        # 创建卡组选择页面
-        self.card_select_page = CardSelectPage(self)
-        self.stacked_widget.addWidget(self.card_select_page)
-        
-        # 创建参数设置页面
-        self.config_page = ConfigPage(self)
-        self.stacked_widget.addWidget(self.config_page)
-        
-        # 创建卡组分享页面
-        self.share_page = SharePage(self)
-        self.stacked_widget.addWidget(self.share_page)
-        
-        # 创建自己卡组页面
-        self.my_deck_page = MyDeckPage(self)
-        self.stacked_widget.addWidget(self.my_deck_page)
-        
-        # 创建卡牌优先级独立页面
-        self.card_priority_page = CardPriorityPage(self)
-        self.stacked_widget.addWidget(self.card_priority_page)
+        # 其余页面首次切换到时才创建，先用空白占位保持页面索引不变
+        # 索引: 1 卡组选择, 2 参数设置, 3 卡组分享, 4 自己卡组, 5 卡牌优先级
+        self._page_factories = {
+            1: ('card_select_page', CardSelectPage),
+            2: ('config_page', ConfigPage),
+            3: ('share_page', SharePage),
+            4: ('my_deck_page', MyDeckPage),
+            5: ('card_priority_page', CardPriorityPage),
+        }
+        for _ in self._page_factories:
+            self.stacked_widget.addWidget(QWidget())
+        self.stacked_widget.currentChanged.connect(self.ensure_page)
+        self.stacked_widget.currentChanged.connect(self.on_page_changed)
         
         self.setCentralWidget(central_widget)
     
+    def create_main_button(self, text, slot):
+        """创建主页面按钮；高度由主样式表的 mainButton 属性规则统一设置"""
+        button = QPushButton(text)
+        button.setProperty("mainButton", True)
+        button.clicked.connect(slot)
+        return button
+    
+    def go_to_page(self):
+        """主页面功能按钮共用的槽：切换到按钮 pageIndex 属性指定的页面"""
+        self.stacked_widget.setCurrentIndex(self.sender().property("pageIndex"))
+    
+    def on_page_changed(self, index):
+        """回到主页面时写入切走期间积压的日志"""
+        if index == 0:
+            self.flush_logs()
+    
+    def ensure_page(self, index):
+        """切换到尚未创建的页面时创建它并替换占位控件"""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
+        attr_name, page_cls = factory
+        page = page_cls(self)
+        setattr(self, attr_name, page)
+        placeholder = self.stacked_widget.widget(index)
+        # 替换过程中会临时改变当前页，屏蔽信号避免连带创建其它页面
+        self.stacked_widget.blockSignals(True)
+        self.stacked_widget.insertWidget(index, page)
+        self.stacked_widget.removeWidget(placeholder)
+        self.stacked_widget.setCurrentWidget(page)
+        self.stacked_widget.blockSignals(False)
+        placeholder.deleteLater()
+    
     def set_background(self):
         # 创建调色板
         palette = self.palette()
@@ -2399,56 +2608,38 @@ class ShadowverseUI(QMainWindow):
         # 状态设置
         status_frame = QFrame()
         status_frame.setObjectName("StatsFrame")
-        frame_layout = QVBoxLayout(status_frame)
+        # 三行“标签: 控件”由一个表单布局承担，控件保持自身宽度靠左排列
+        frame_layout = QFormLayout(status_frame)
+        frame_layout.setFieldGrowthPolicy(QFormLayout.FieldsStayAtSizeHint)
         
         # 服务器切换
-        server_layout = QHBoxLayout()
-        server_layout.addWidget(QLabel("服务器:"))
         self.server_combo = QComboBox()
         self.server_combo.addItems(["国服", "国际服"])
-        self.server_combo.setStyleSheet("background-color: rgba(80, 80, 120, 180); color: white;")
-        server_layout.addWidget(self.server_combo)
-        server_layout.addStretch()
-        frame_layout.addLayout(server_layout)
+        self.server_combo.setObjectName("ServerCombo")
+        frame_layout.addRow("服务器:", self.server_combo)
         
         # ADB端口
-        adb_layout = QHBoxLayout()
-        adb_layout.addWidget(QLabel("ADB 端口:"))
-        self.adb_input = QLineEdit("127.0.0.1:16384")
+        self.adb_input = QLineEdit(DEFAULT_ADB_SERIAL)
         self.adb_input.setFixedWidth(150)  # 增加宽度以完整显示地址
-        self.adb_input.setStyleSheet("background-color: rgba(80, 80, 120, 180); color: white;")
-        adb_layout.addWidget(self.adb_input)
-        adb_layout.addStretch()
-        frame_layout.addLayout(adb_layout)
+        self.adb_input.setObjectName("AdbInput")
+        frame_layout.addRow("ADB 端口:", self.adb_input)
         
         # 深色识别
-        dark_layout = QHBoxLayout()
-        dark_layout.addWidget(QLabel("深色识别:"))
         self.deep_color_checkbox = QCheckBox()
-        self.deep_color_checkbox.setStyleSheet("QCheckBox::indicator { width: 20px; height: 20px; }")
-        dark_layout.addWidget(self.deep_color_checkbox)
-        dark_layout.addStretch()
-        frame_layout.addLayout(dark_layout)
+        self.deep_color_checkbox.setObjectName("DeepColorCheckBox")
+        frame_layout.addRow("深色识别:", self.deep_color_checkbox)
         
         left_layout.addWidget(status_frame)
         
         # 控制按钮
         btn_layout = QGridLayout()
-        self.connect_btn = QPushButton("连接设备")
-        self.connect_btn.setFixedHeight(35)
-        self.connect_btn.clicked.connect(self.connect_device)
+        self.connect_btn = self.create_main_button("连接设备", self.connect_device)
         
-        self.start_btn = QPushButton("开始运行")
-        self.start_btn.setFixedHeight(35)
-        self.start_btn.clicked.connect(self.start_script)
+        self.start_btn = self.create_main_button("开始运行", self.start_script)
         
-        self.pause_btn = QPushButton("暂停运行")
-        self.pause_btn.setFixedHeight(35)
-        self.pause_btn.clicked.connect(self.pause_script)
+        self.pause_btn = self.create_main_button("暂停运行", self.pause_script)
         
-        self.resume_btn = QPushButton("恢复运行")
-        self.resume_btn.setFixedHeight(35)
-        self.resume_btn.clicked.connect(self.resume_script)
+        self.resume_btn = self.create_main_button("恢复运行", self.resume_script)
         
         # 第一行：连接设备 | 开始运行
         btn_layout.addWidget(self.connect_btn, 0, 0)
@@ -2472,7 +2663,9 @@ class ShadowverseUI(QMainWindow):
         # 只保留当前状态和运行时间
         grid_layout.addWidget(QLabel("当前状态:"), 0, 0)
         self.status_label = QLabel("未连接")
-        self.status_label.setStyleSheet("color: #FF5555;")
+        # 颜色由主样式表按 state 属性决定，切换状态时无需重新解析样式表
+        self.status_label.setObjectName("StatusLabel")
+        self.status_label.setProperty("state", "stop")
         grid_layout.addWidget(self.status_label, 0, 1)
         
         grid_layout.addWidget(QLabel("运行时间:"), 1, 0)
@@ -2488,25 +2681,20 @@ class ShadowverseUI(QMainWindow):
         right_layout = QVBoxLayout(right_widget)
         right_layout.setSpacing(8)
         
-        self.card_select_btn = QPushButton("卡组选择")
-        self.card_select_btn.setFixedHeight(35)
-        self.card_select_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
+        self.card_select_btn = self.create_main_button("卡组选择", self.go_to_page)
+        self.card_select_btn.setProperty("pageIndex", 1)
         
-        self.config_btn = QPushButton("参数设置")
-        self.config_btn.setFixedHeight(35)
-        self.config_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(2))
+        self.config_btn = self.create_main_button("参数设置", self.go_to_page)
+        self.config_btn.setProperty("pageIndex", 2)
         
-        self.card_priority_btn = QPushButton("卡牌优先级")
-        self.card_priority_btn.setFixedHeight(35)
-        self.card_priority_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(5))
+        self.card_priority_btn = self.create_main_button("卡牌优先级", self.go_to_page)
+        self.card_priority_btn.setProperty("pageIndex", 5)
         
-        self.my_deck_btn = QPushButton("我的卡组")
-        self.my_deck_btn.setFixedHeight(35)
-        self.my_deck_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(4))
+        self.my_deck_btn = self.create_main_button("我的卡组", self.go_to_page)
+        self.my_deck_btn.setProperty("pageIndex", 4)
         
-        self.share_btn = QPushButton("卡组应用和分享")
-        self.share_btn.setFixedHeight(35)
-        self.share_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(3))
+        self.share_btn = self.create_main_button("卡组应用和分享", self.go_to_page)
+        self.share_btn.setProperty("pageIndex", 3)
         
         # 紧凑排列按钮
         right_layout.addWidget(self.card_select_btn) # 卡组选择按钮        
@@ -2526,8 +2714,11 @@ class ShadowverseUI(QMainWindow):
         log_label = QLabel("运行日志:")
         log_layout.addWidget(log_label)
         
-        self.log_output = QTextEdit()
+        # 纯文本日志控件开销远低于富文本 QTextEdit；限制最大行数，超出后自动丢弃最早的日志
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_output.setCenterOnScroll(False)
         self.log_output.setMinimumHeight(300)  # 增大日志区域高度
         log_layout.addWidget(self.log_output)
         
@@ -2538,41 +2729,43 @@ class ShadowverseUI(QMainWindow):
         self.pause_btn.setEnabled(False)
         self.resume_btn.setEnabled(False)
         
-        # 加载当前配置设置
-        self.load_current_config()
+        # 输入框先显示默认值，配置文件在窗口显示后于后台线程读取
+        QTimer.singleShot(0, self.load_current_config)
     
     def load_current_config(self):
-        """加载当前配置设置"""
-        config_path = os.path.join(get_exe_dir(), "config.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                # 设置服务器选项
-                devices = config.get("devices", [])
-                if devices:
-                    # 获取最后一个设备作为当前设备
-                    last_device = devices[-1]
-                    self.adb_input.setText(last_device["serial"])
-                    
-                    if last_device.get("is_global", False):
-                        self.server_combo.setCurrentText("国际服")
-                    else:
-                        self.server_combo.setCurrentText("国服")
-                    
-                    # 设置深色识别选项
-                    self.deep_color_checkbox.setChecked(last_device.get("screenshot_deep_color", False))
-                else:
-                    # 如果没有设备配置，设置默认值
-                    self.adb_input.setText("127.0.0.1:16384")
-            except Exception as e:
-                self.log_output.append(f"加载配置失败: {str(e)}")
-                # 出错时也设置默认值
-                self.adb_input.setText("127.0.0.1:16384")
-        else:
-            # 如果配置文件不存在，设置默认值
-            self.adb_input.setText("127.0.0.1:16384")
+        """在线程池中读取配置，读取完成后在GUI线程填入设备设置"""
+        signals = ConfigLoadSignals(self)
+        signals.loaded.connect(self.apply_loaded_config)
+        signals.failed.connect(lambda error: self.append_log(f"加载配置失败: {error}"))
+        signals.loaded.connect(signals.deleteLater)
+        signals.failed.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(ConfigLoadJob(CONFIG_PATH, signals))
+    
+    def apply_loaded_config(self, config):
+        """用配置中的最后一个设备填充服务器、ADB端口与深色识别选项；没有设备时保留默认值"""
+        devices = config.get("devices", [])
+        if not devices:
+            return
+        last_device = devices[-1]
+        # 程序化填值不需要触发控件信号；暂停重绘，三处修改合并为一次绘制
+        widgets = (self.adb_input, self.server_combo, self.deep_color_checkbox)
+        self.main_page.setUpdatesEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            self.adb_input.setText(last_device.get("serial", DEFAULT_ADB_SERIAL))
+            
+            if last_device.get("is_global", False):
+                self.server_combo.setCurrentText("国际服")
+            else:
+                self.server_combo.setCurrentText("国服")
+            
+            # 设置深色识别选项
+            self.deep_color_checkbox.setChecked(last_device.get("screenshot_deep_color", False))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+            self.main_page.setUpdatesEnabled(True)
     
     def toggle_maximize(self):
         if self.isMaximized():
@@ -2591,54 +2784,50 @@ class ShadowverseUI(QMainWindow):
         is_global = self.server_combo.currentText() == "国际服"
         deep_color = self.deep_color_checkbox.isChecked()
         
-        # 更新配置文件
-        config_path = os.path.join(get_exe_dir(), "config.json")
-        config = {}
-        
-        try:
-            # 读取现有配置
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            
-            # 每次只保留当前连接的设备 - 优化点
-            config["devices"] = []  # 清空现有设备列表
-            
-            # 添加新设备
-            new_device = {
-                "name": f"模拟器-{adb_port}",
-                "serial": adb_port,
-                "is_global": is_global,
-                "screenshot_deep_color": deep_color
-            }
-            config["devices"].append(new_device)
-            
-            # 保存配置
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
-            
-            self.append_log(f"设备设置已更新: 服务器={self.server_combo.currentText()}, 深色识别={'开启' if deep_color else '关闭'}")
-            
-        except Exception as e:
-            self.append_log(f"更新配置文件失败: {str(e)}")
+        # 每次只保留当前连接的设备；其余配置由保存线程从缓存中合并，写入不阻塞界面
+        new_device = {
+            "name": f"模拟器-{adb_port}",
+            "serial": adb_port,
+            "is_global": is_global,
+            "screenshot_deep_color": deep_color
+        }
+        self._device_save_message = f"设备设置已更新: 服务器={self.server_combo.currentText()}, 深色识别={'开启' if deep_color else '关闭'}"
+        self._device_save_worker = ConfigSaveWorker(CONFIG_PATH, {"devices": [new_device]}, self)
+        self._device_save_worker.result_signal.connect(self.on_device_config_saved)
+        self._device_save_worker.start()
         
-        # 创建脚本运行线程
+        # 创建脚本运行线程（此时才导入主脚本模块）
+        self.ensure_script_backend()
         self.script_thread = ScriptRunner()
-        self.script_thread.status_signal.connect(self.update_status)
-        self.script_thread.stats_signal.connect(self.update_stats)
+        # 信号总是从脚本线程发往GUI线程，显式使用排队连接
+        self.script_thread.status_signal.connect(self.update_status, Qt.QueuedConnection)
+        self.script_thread.stats_signal.connect(self.update_stats, Qt.QueuedConnection)
         
         # 模拟连接成功
+        self.set_status("已连接", "run")
+    
+    def on_device_config_saved(self, success, error):
+        """设备配置写入完成（在GUI线程执行）；脚本启动时会读取该配置，因此写完后才允许开始运行"""
+        if success:
+            self.append_log(self._device_save_message)
+        else:
+            self.append_log(f"更新配置文件失败: {error}")
         self.start_btn.setEnabled(True)
-        self.status_label.setText("已连接")
-        self.status_label.setStyleSheet("color: #55FF55;")
     
     def append_log(self, message):
-        """安全地添加日志到UI"""
-        self.log_output.append(message)
-        # 自动滚动到底部
-        self.log_output.verticalScrollBar().setValue(
-            self.log_output.verticalScrollBar().maximum()
-        )
+        """安全地添加日志到UI（先进入缓冲区，稍后批量写入）"""
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def flush_logs(self):
+        """把缓冲的日志合并为一次写入；当前不在主页面时暂不写入"""
+        if not self._log_buffer or self.stacked_widget.currentIndex() != 0:
+            return
+        batch = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        # appendPlainText 不解析HTML；滚动条原本在底部时会自动跟随，用户向上翻看时保持位置不动
+        self.log_output.appendPlainText(batch)
     
     def start_script(self):
         if self.script_thread and not self.script_thread.isRunning():
@@ -2653,9 +2842,8 @@ class ShadowverseUI(QMainWindow):
         """暂停脚本执行"""
         if self.script_thread and self.script_thread.isRunning():
             # 发送暂停命令
-            command_queue.put('p')
-            self.status_label.setText("已暂停")
-            self.status_label.setStyleSheet("color: #FFFF55;")
+            self._script_backend.command_queue.put('p')
+            self.set_status("已暂停", "pause")
             self.pause_btn.setEnabled(False)
             self.resume_btn.setEnabled(True)
             self.timer.stop()
@@ -2665,49 +2853,58 @@ class ShadowverseUI(QMainWindow):
         """恢复脚本执行"""
         if self.script_thread and self.script_thread.isRunning():
             # 发送恢复命令
-            command_queue.put('r')
-            self.status_label.setText("运行中")
-            self.status_label.setStyleSheet("color: #55FF55;")
+            self._script_backend.command_queue.put('r')
+            self.set_status("运行中", "run")
             self.pause_btn.setEnabled(True)
             self.resume_btn.setEnabled(False)
             self.timer.start(1000)
             self.append_log("[控制] 脚本已恢复")
     
     def calculate_avg_turns(self):
-        battle_count = int(self.battle_count_label.text()) if self.battle_count_label.text() else 0
-        turn_count = int(self.turn_count_label.text()) if self.turn_count_label.text() else 0
-        return round(turn_count / battle_count, 2) if battle_count > 0 else 0
+        """平均回合数，直接使用 update_stats 记录的整数计数"""
+        return round(self.turn_count / self.battle_count, 2) if self.battle_count > 0 else 0
+    
+    def set_status(self, text, state):
+        """更新状态文字；state 为 run/pause/stop，仅在状态变化时重新应用样式"""
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
     
     def update_status(self, status):
-        self.status_label.setText(status)
         if status == "运行中":
-            self.status_label.setStyleSheet("color: #55FF55;")
+            self.set_status(status, "run")
             self.pause_btn.setEnabled(True)
             self.resume_btn.setEnabled(False)
         elif status == "已暂停":
-            self.status_label.setStyleSheet("color: #FFFF55;")
+            self.set_status(status, "pause")
             self.pause_btn.setEnabled(False)
             self.resume_btn.setEnabled(True)
         else:
-            self.status_label.setStyleSheet("color: #FF5555;")
+            self.set_status(status, "stop")
     
     def update_stats(self, stats):
-        # 不再更新被删除的统计项
+        # 对战/回合计数以整数保存（对应的显示项已删除），不再从标签文字解析
+        self.battle_count = stats.get('battle_count', self.battle_count)
+        self.turn_count = stats.get('turn_count', self.turn_count)
         # 更新运行时间
-        run_time = stats.get('run_time', 0)
-        hours = run_time // 3600
-        minutes = (run_time % 3600) // 60
-        seconds = run_time % 60
-        self.run_time_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        self.set_run_time(stats.get('run_time', 0))
     
     def update_run_time(self):
         # 更新运行时间显示
-        if self.script_thread and self.script_thread.isRunning():
-            run_time = int(time.time() - self.script_thread.start_time)
-            hours = run_time // 3600
-            minutes = (run_time % 3600) // 60
-            seconds = run_time % 60
-            self.run_time_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        if self.script_thread and self.script_thread.isRunning() and self.script_thread.elapsed.isValid():
+            self.set_run_time(self.script_thread.elapsed.elapsed() // 1000)
+    
+    def set_run_time(self, run_time):
+        """显示运行时间，文字未变化时不刷新标签"""
+        hours, rest = divmod(run_time, 3600)
+        minutes, seconds = divmod(rest, 60)
+        text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if text != self._last_run_time_text:
+            self._last_run_time_text = text
+            self.run_time_label.setText(text)
     
     # 添加鼠标事件处理以实现窗口拖动
     def mousePressEvent(self, event):
@@ -2722,41 +2919,108 @@ class ShadowverseUI(QMainWindow):
     
     def closeEvent(self, event):
         """窗口关闭事件处理"""
-        # 停止日志监听
-        if self.log_listener.isRunning():
-            self.log_listener.stop()
-            self.log_listener.wait(1000)
+        # 注销日志推送
+        if self._script_backend is not None:
+            self._script_backend.set_log_callback(None)
         
         # 停止脚本线程
         if self.script_thread and self.script_thread.isRunning():
             # 发送退出命令
-            command_queue.put('e')
+            self._script_backend.command_queue.put('e')
             self.script_thread.quit()
             self.script_thread.wait(2000)  # 等待2秒
         
         event.accept()
 
-class LogListener(QThread):
-    """日志监听线程"""
-    log_signal = pyqtSignal(str)
-    
-    def __init__(self, parent=None):
+class CardImageDecodeSignals(QObject):
+    """卡片图片解码结果信号（QRunnable 本身不能发射信号）"""
+    decoded = pyqtSignal(int, int, str, QImage)  # (批次号, 槽位序号, 缓存键, 缩放后的图片)
+
+class CardImageDecodeTask(QRunnable):
+    """在线程池中解码并缩放卡片图片；QPixmap 只能在GUI线程创建，因此这里只生成 QImage"""
+
+    def __init__(self, generation, index, path, cache_key, size, signals):
+        super().__init__()
+        self.generation = generation
+        self.index = index
+        self.path = path
+        self.cache_key = cache_key
+        self.size = QSize(size)
+        self.signals = signals
+
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(self.size, Qt.KeepAspectRatio, THUMBNAIL_TRANSFORM)
+        self.signals.decoded.emit(self.generation, self.index, self.cache_key, image)
+
+class DeckIOSignals(QObject):
+    """卡组文件操作完成信号"""
+    finished = pyqtSignal(int)  # 成功放入的卡片数量
+
+class DeckIOJob(QRunnable):
+    """清空卡组目录并放入卡片（硬链接/复制），避免大量文件操作阻塞GUI线程"""
+
+    def __init__(self, target_dir, pairs, signals):
+        super().__init__()
+        self.target_dir = target_dir
+        self.pairs = pairs
+        self.signals = signals
+
+    def run(self):
+        success_count = 0
+        try:
+            _reset_deck_dir(self.target_dir)
+            success_count = place_card_files(self.pairs)
+        except Exception as e:
+            print(f"重建卡组目录失败: {self.target_dir} - {e}")
+        self.signals.finished.emit(success_count)
+
+class ConfigLoadSignals(QObject):
+    """配置读取结果信号"""
+    loaded = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+class ConfigLoadJob(QRunnable):
+    """在线程池中读取并解析配置文件，避免启动时阻塞首帧绘制"""
+
+    def __init__(self, config_path, signals):
+        super().__init__()
+        self.config_path = config_path
+        self.signals = signals
+
+    def run(self):
+        try:
+            config = read_config_cached(self.config_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(config)
+
+class ConfigSaveWorker(QThread):
+    """配置保存线程：读取现有配置、合并更新并写回磁盘"""
+    result_signal = pyqtSignal(bool, str)  # (是否成功, 错误信息)
+
+    def __init__(self, config_path, updates, parent=None):
         super().__init__(parent)
-        self.running = True
-        
+        self.config_path = config_path
+        self.updates = updates
+
     def run(self):
-        while self.running:
-            try:
-                # 非阻塞获取日志
-                while not log_queue.empty():
-                    log = log_queue.get_nowait()
-                    self.log_signal.emit(log)
-                time.sleep(0.1)  # 避免CPU占用过高
-            except Exception as e:
-                print(f"日志监听异常: {str(e)}")
-    
-    def stop(self):
-        self.running = False
+        try:
+            with CONFIG_WRITE_LOCK:
+                # 读取现有配置以保留其它部分（例如 high_priority_cards）
+                try:
+                    existing = read_config_cached(self.config_path)
+                except Exception:
+                    existing = {}
+
+                # 合并
+                existing.update(self.updates)
+                write_config_atomic(self.config_path, existing)
+            self.result_signal.emit(True, "")
+        except Exception as e:
+            self.result_signal.emit(False, str(e))
 
 class ScriptRunner(QThread):
     """脚本运行线程"""
@@ -2765,28 +3029,29 @@ class ScriptRunner(QThread):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.start_time = 0
+        self.elapsed = QElapsedTimer()  # 单调时钟计时，不受系统时间调整影响；run 开始时启动
         self.battle_count = 0
         self.turn_count = 0
         self.current_turn = 0
     
     def run(self):
         try:
-            self.start_time = time.time()
+            self.elapsed.start()
             self.status_signal.emit("运行中")
             
             # 运行主脚本（启用命令监听）
-            run_main_script(enable_command_listener=True)
+            _lazy_import_main().main(enable_command_listener=True)
                 
         except Exception as e:
-            log_queue.put(f"脚本运行出错: {str(e)}")
+            _lazy_import_main().publish_log(f"脚本运行出错: {str(e)}")
             traceback.print_exc()
         finally:
             self.status_signal.emit("已停止")
-            log_queue.put("===== 脚本运行结束 =====")
+            _lazy_import_main().publish_log("===== 脚本运行结束 =====")
 
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(131072)  # 128MB，各页面共用的卡片缩略图缓存
     window = ShadowverseUI()
     window.show()
     sys.exit(app.exec_())
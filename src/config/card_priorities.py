@@ -65,13 +65,18 @@ def load_user_config():
 _user_config = None
 _HIGH_PRIORITY_CARDS = None
 _EVOLVE_PRIORITY_CARDS = None
+# 由配置派生的查找表，随 reload_config 一起重建：高优先级卡名集合、卡名 -> 优先级
+_HIGH_PRIORITY_NAMES = frozenset()
+_CARD_PRIORITY_MAP = {}
 
 def reload_config():
     """重新加载配置文件"""
-    global _user_config, _HIGH_PRIORITY_CARDS, _EVOLVE_PRIORITY_CARDS
+    global _user_config, _HIGH_PRIORITY_CARDS, _EVOLVE_PRIORITY_CARDS, _HIGH_PRIORITY_NAMES, _CARD_PRIORITY_MAP
     _user_config = load_user_config()
     _HIGH_PRIORITY_CARDS = _user_config.get('high_priority_cards', DEFAULT_HIGH_PRIORITY_CARDS)
     _EVOLVE_PRIORITY_CARDS = _user_config.get('evolve_priority_cards', DEFAULT_EVOLVE_PRIORITY_CARDS)
+    _HIGH_PRIORITY_NAMES = frozenset(_HIGH_PRIORITY_CARDS)
+    _CARD_PRIORITY_MAP = {name: info.get("priority", 999) for name, info in _HIGH_PRIORITY_CARDS.items()}
     print(f"重新加载配置完成，高优先级卡牌: {list(_HIGH_PRIORITY_CARDS.keys())}")
     print(f"重新加载配置完成，进化优先级卡牌: {list(_EVOLVE_PRIORITY_CARDS.keys())}")
 
@@ -82,6 +87,10 @@ def get_high_priority_cards():
     """获取高优先级卡牌列表"""
     return _HIGH_PRIORITY_CARDS
 
+def get_high_priority_names():
+    """获取高优先级卡牌名称集合"""
+    return _HIGH_PRIORITY_NAMES
+
 def get_special_cards():
     """获取特殊处理卡牌列表"""
     from src.game.card_play_special_actions import get_special_cards
@@ -89,7 +98,7 @@ def get_special_cards():
 
 def is_high_priority_card(card_name):
     """检查是否为高优先级卡牌"""
-    return card_name in _HIGH_PRIORITY_CARDS
+    return card_name in _HIGH_PRIORITY_NAMES
 
 def is_special_card(card_name):
     """检查是否为特殊处理卡牌"""
@@ -99,9 +108,11 @@ def is_special_card(card_name):
 
 def get_card_priority(card_name):
     """获取卡牌优先级（数字越小优先级越高）"""
-    if card_name in _HIGH_PRIORITY_CARDS:
-        return _HIGH_PRIORITY_CARDS[card_name].get("priority", 999)
-    return 999  # 默认低优先级
+    return _CARD_PRIORITY_MAP.get(card_name, 999)  # 默认低优先级
+
+def card_priority_sort_key(card):
+    """手牌排序键：先按优先级（数字小优先），再按费用从高到低"""
+    return (_CARD_PRIORITY_MAP.get(card.get('name', ''), 999), -card.get('cost', 0))
 
 def get_card_info(card_name):
     """获取卡牌信息"""
@@ -21,6 +21,12 @@ OUR_HP_REGION = (263, 466, 1015, 480)
 # 敌方护盾检测区域 (左上角x, 左上角y, 右下角x, 右下角y)
 ENEMY_SHIELD_REGION = (164, 136, 1096, 228)
 
+# 进化/超进化按钮搜索区域：点击我方随从后按钮出现在我方场地一带，只在此范围内匹配
+EVOLVE_BUTTON_ROI = (100, 240, 1180, 620)
+
+# 等待动画结束时用于判断画面是否稳定的区域（敌我双方场地）
+UI_SETTLE_ROI = (164, 136, 1096, 480)
+
 # 敌方随从位置偏移
 ENEMY_FOLLOWER_OFFSET_X = -50  # 从血量中心到随从中心的X偏移
 ENEMY_FOLLOWER_OFFSET_Y = -70  # 从血量中心到随从中心的Y偏移
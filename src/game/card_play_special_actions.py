@@ -56,8 +56,10 @@ def get_special_cards():
 class CardPlaySpecialActions:
     """出牌特殊操作处理类"""
     
-    def __init__(self, device_state: 'DeviceState'):
+    def __init__(self, device_state: 'DeviceState', drag_duration):
         self.device_state = device_state
+        # 返回随机拖拽时长的函数，由 GameActions 提供（区间每回合只读取一次配置）
+        self.drag_duration = drag_duration
     
     def play_single_card(self, card):
         """打出单张牌"""
@@ -143,7 +145,7 @@ class CardPlaySpecialActions:
         """处理选择敌方玩家目标"""
         self.device_state.logger.info(f"检测到{card_name}，划出卡牌后选择敌方玩家目标")
         # 划出卡牌
-        human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+        human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
         time.sleep(0.8)  # 等待
         
         enemy_x = DEFAULT_ATTACK_TARGET[0] + random.randint(-DEFAULT_ATTACK_RANDOM, DEFAULT_ATTACK_RANDOM)
@@ -161,7 +163,7 @@ class CardPlaySpecialActions:
             if enemy_followers:
                 self.device_state.logger.info("检测到敌方随从，划出卡牌后破坏血量最高的敌方随从")
                 # 划出卡牌
-                human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+                human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
                 time.sleep(0.9)  # 等待0.2秒
                 # 找出血量最高的随从
                 # 找出血量最高的随从（若>1个则取前两个并依次点击）
@@ -228,7 +230,7 @@ class CardPlaySpecialActions:
         if shield_detected:
             self.device_state.logger.info("检测到护盾，划出卡牌后破坏护盾随从")
             # 划出卡牌
-            human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+            human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
             time.sleep(0.9)  # 等待
             
             # 点击护盾随从（选择第一个护盾）
@@ -238,7 +240,7 @@ class CardPlaySpecialActions:
         else:
             self.device_state.logger.info("未检测到护盾，尝试检测血量最高的敌方随从")
             # 划出卡牌
-            human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+            human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
             time.sleep(0.9)  # 等待0.2秒
             
             # 检测敌方随从
@@ -294,7 +296,7 @@ class CardPlaySpecialActions:
         if shield_detected:
             self.device_state.logger.info("检测到护盾，划出卡牌后破坏护盾随从")
             # 划出卡牌
-            human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+            human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
             time.sleep(0.9)  # 等待
             
             # 点击护盾随从（选择第一个护盾）
@@ -311,7 +313,7 @@ class CardPlaySpecialActions:
                 if enemy_followers:
                     self.device_state.logger.info("检测到敌方随从，划出卡牌后破坏血量最高的敌方随从")
                     # 划出卡牌
-                    human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+                    human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
                     time.sleep(0.9)  # 等待0.2秒
                     
                     # 找出血量最高的随从
@@ -343,7 +345,7 @@ class CardPlaySpecialActions:
             
             if valid_targets:
                 # 划出该手牌
-                human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+                human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
                 time.sleep(0.9)
                 
                 # 选择血量最大的
@@ -357,7 +359,7 @@ class CardPlaySpecialActions:
                     # 有敌方随从，选择血量最大的
                     self.device_state.logger.info(f"划出[{card_name}]，未检测到血量小于5的敌方随从，选择血量最大的敌方随从")
                     # 划出该手牌
-                    human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+                    human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
                     time.sleep(0.9)
                     
                     # 选择血量最大的敌方随从
@@ -375,7 +377,7 @@ class CardPlaySpecialActions:
                     # 一个敌方随从都没有，点击指定位置
                     self.device_state.logger.info(f"划出[{card_name}]，未检测到任何敌方随从")
                     # 划出该手牌
-                    human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+                    human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
                     time.sleep(0.9)
                     
                     # 点击指定位置 (611, 227)
@@ -384,7 +386,7 @@ class CardPlaySpecialActions:
     
     def _default_card_play(self, center_x, center_y, target_x):
         """默认卡牌打出"""
-        human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+        human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
     
 
     
@@ -411,7 +413,7 @@ class CardPlaySpecialActions:
         time.sleep(0.2)  # 等待
 
         # 划出卡牌
-        human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400)
+        human_like_drag(self.device_state.u2_device, center_x, center_y, target_x, 400, duration=self.drag_duration())
         time.sleep(0.2)  # 等待
         if screenshot:
             our_followers = self._scan_our_followers(screenshot)
@@ -1,6 +1,8 @@
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import random
 
+import numpy as np
+
 
 class FollowerManager:
     """随从管理器，用于管理我方和敌方随从的位置信息"""
@@ -8,10 +10,19 @@ class FollowerManager:
     def __init__(self):
         self.positions: List[Tuple[int, int, str, str]] = []
         self.enemy_positions: List[Tuple[int, int, str, str]] = []
+        # 按类型分组的随从坐标数组 (n, 2) 及对应的 (x, y, 名称) 列表，随 update_positions 刷新
+        self._xy_by_type: Dict[str, Tuple[np.ndarray, List[Tuple[int, int, str]]]] = {}
     
     def update_positions(self, positions: List[Tuple[int, int, str, str]]):
         """更新我方随从位置"""
         self.positions = positions
+        grouped: Dict[str, List[Tuple[int, int, str]]] = {}
+        for x, y, ftype, name in positions:
+            grouped.setdefault(ftype, []).append((x, y, name))
+        self._xy_by_type = {
+            ftype: (np.array([(x, y) for x, y, _ in entries], dtype=np.int32), entries)
+            for ftype, entries in grouped.items()
+        }
     
     def get_positions(self) -> List[Tuple[int, int, str, str]]:
         """获取我方随从位置"""
@@ -23,7 +34,15 @@ class FollowerManager:
     
     def get_by_type(self, follower_type: str) -> List[Tuple[int, int]]:
         """根据类型获取随从位置"""
-        return [(x, y) for x, y, ftype, _ in self.positions if ftype == follower_type]
+        return [(x, y) for x, y, _ in self.get_xy_by_type(follower_type)[1]]
+    
+    def get_xy_by_type(self, follower_type: str) -> Tuple[Optional[np.ndarray], List[Tuple[int, int, str]]]:
+        """获取某类型随从的坐标数组 (n, 2) 与对应的 (x, y, 名称) 列表；没有该类型时返回 (None, [])"""
+        return self._xy_by_type.get(follower_type, (None, []))
+
+    def has_any_type(self, *follower_types: str) -> bool:
+        """是否存在任一给定类型的随从"""
+        return any(ftype in self._xy_by_type for ftype in follower_types)
     
     def update_enemy_positions(self, enemy_positions: List[Tuple[int, int, str, str]]):
         """更新敌方随从位置"""
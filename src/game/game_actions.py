@@ -4,6 +4,8 @@
 """
 
 from errno import ECANCELED
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 import random
@@ -16,11 +18,11 @@ from torch import device
 from src.config import settings
 from src.config.game_constants import (
     DEFAULT_ATTACK_TARGET, DEFAULT_ATTACK_RANDOM,
-    POSITION_RANDOM_RANGE, SHOW_CARDS_BUTTON, SHOW_CARDS_RANDOM_X, SHOW_CARDS_RANDOM_Y,
-    BLANK_CLICK_POSITION, BLANK_CLICK_RANDOM
+    SHOW_CARDS_BUTTON, SHOW_CARDS_RANDOM_X, SHOW_CARDS_RANDOM_Y,
+    BLANK_CLICK_POSITION, BLANK_CLICK_RANDOM, UI_SETTLE_ROI
 )
 import math
-from src.config.card_priorities import get_card_priority, is_evolve_priority_card, get_evolve_priority_cards, is_evolve_special_action_card, get_evolve_special_actions
+from src.config.card_priorities import card_priority_sort_key, is_evolve_priority_card, get_evolve_priority_cards, is_evolve_special_action_card, get_evolve_special_actions
 from src.config.config_manager import ConfigManager
 import glob
 
@@ -35,12 +37,85 @@ class GameActions:
         # 初始化手牌管理器，只创建一次
         from .hand_card_manager import HandCardManager
         self.hand_manager = HandCardManager(device_state)
+        # 常驻线程池，跨回合复用，用于与点击操作并发的识别任务
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="svbb")
+        atexit.register(self._executor.shutdown)
+        # 预先批量生成的随机偏移：(low, high) -> [数组, 下一个可用下标]
+        self._jitter_pools = {}
+        # 拖拽时长区间每回合只从配置读取一次
+        self._drag_duration_range = None
+        # 复用的截图缓冲区：BGR帧与其灰度图，尺寸变化时才重新分配
+        self._frame_bgr = None
+        self._frame_gray = None
     
     @property
     def follower_manager(self):
         """动态获取follower_manager，确保在GameManager初始化后才可用"""
         return self.device_state.follower_manager
 
+    def _begin_turn(self):
+        """回合开始时刷新每回合缓存的配置"""
+        self._drag_duration_range = settings.get_human_like_drag_duration_range()
+
+    def _jitter(self, low, high):
+        """返回 [low, high] 内的随机整数，从批量生成的数组中依次取用，用完再补充"""
+        pool = self._jitter_pools.get((low, high))
+        if pool is None or pool[1] >= len(pool[0]):
+            pool = [np.random.randint(low, high + 1, size=64), 0]
+            self._jitter_pools[(low, high)] = pool
+        value = int(pool[0][pool[1]])
+        pool[1] += 1
+        return value
+
+    def _drag_duration(self):
+        """随机拖拽时长，区间取自本回合缓存的配置"""
+        if self._drag_duration_range is None:
+            self._begin_turn()
+        return random.uniform(*self._drag_duration_range)
+
+    def _grab_bgr(self):
+        """截图并转换为BGR写入复用缓冲区，返回该缓冲区；截图失败返回None。
+        返回的数组在下一次调用时会被覆盖，需要跨截图保留时请自行copy()"""
+        screenshot = self.device_state.take_screenshot()
+        if screenshot is None:
+            return None
+        rgb = np.asarray(screenshot)
+        if self._frame_bgr is None or self._frame_bgr.shape != rgb.shape:
+            self._frame_bgr = np.empty(rgb.shape, dtype=np.uint8)
+            self._frame_gray = np.empty(rgb.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=self._frame_bgr)
+        return self._frame_bgr
+
+    def _frame_to_gray(self):
+        """把当前BGR缓冲区转换为灰度写入复用缓冲区并返回"""
+        cv2.cvtColor(self._frame_bgr, cv2.COLOR_BGR2GRAY, dst=self._frame_gray)
+        return self._frame_gray
+
+    def _wait_for_ui_settle(self, max_wait=3.5, poll=0.08, diff_threshold=2.0, min_wait=0.5):
+        """等待画面稳定：先等 min_wait 让动画开始，再轮询 UI_SETTLE_ROI 区域，
+        连续两次与上一帧的平均灰度差低于阈值即返回 True；超过 max_wait 仍未稳定返回 False"""
+        deadline = time.monotonic() + max_wait
+        time.sleep(min(min_wait, max_wait))
+        x1, y1, x2, y2 = UI_SETTLE_ROI
+        prev = None
+        stable_count = 0
+        while time.monotonic() < deadline:
+            frame = self._grab_bgr()
+            if frame is not None:
+                cur = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY)
+                if prev is not None and cv2.absdiff(prev, cur).mean() < diff_threshold:
+                    stable_count += 1
+                    if stable_count >= 2:
+                        return True
+                else:
+                    stable_count = 0
+                prev = cur
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+        return False
+
     def perform_follower_attacks(self,enemy_check):
         """执行随从攻击"""
         type_name_map = {
@@ -50,8 +125,8 @@ class GameActions:
 
         # 对面玩家位置（默认攻击目标）
         default_target = (
-            DEFAULT_ATTACK_TARGET[0] + random.randint(-DEFAULT_ATTACK_RANDOM, DEFAULT_ATTACK_RANDOM),
-            DEFAULT_ATTACK_TARGET[1] + random.randint(-DEFAULT_ATTACK_RANDOM, DEFAULT_ATTACK_RANDOM)
+            DEFAULT_ATTACK_TARGET[0] + self._jitter(-DEFAULT_ATTACK_RANDOM, DEFAULT_ATTACK_RANDOM),
+            DEFAULT_ATTACK_TARGET[1] + self._jitter(-DEFAULT_ATTACK_RANDOM, DEFAULT_ATTACK_RANDOM)
         )
 
         should_check_shield = enemy_check
@@ -61,10 +136,6 @@ class GameActions:
         else:
             shield_detected = False
 
-
-        # 获取当前随从位置和类型
-        all_followers = self.follower_manager.get_positions()
-
         if shield_detected:
             max_attempts = 5  # 最多循环5次
             attempt_count = 0
@@ -72,31 +143,25 @@ class GameActions:
             while shield_targets and attempt_count < max_attempts:
                 attempt_count += 1
                 self.device_state.logger.info(f"破盾尝试第{attempt_count}/5次")
-                current_shield = shield_targets[-1]
-                shield_x, shield_y = current_shield
 
                 closest_follower = None
                 closest_follower_name = None
                 for type_priority in ["yellow", "green"]:
-                    type_followers = [(x, y, name) for x, y, t, name in all_followers if t == type_priority]
+                    follower_xy, type_followers = self.follower_manager.get_xy_by_type(type_priority)
                     if not type_followers:
                         continue
 
-                    # 选择离护盾最近的该类型随从
-                    min_distance = float('inf')
-                    for fx, fy, fname in type_followers:
-                        dist = ((fx - shield_x) ** 2 + (fy - shield_y) ** 2) ** 0.5
-                        if dist < min_distance:
-                            min_distance = dist
-                            closest_follower = (fx, fy)
-                            closest_follower_name = fname
+                    # 在该类型随从与所有护盾之间选出距离最近的一组
+                    closest_follower, closest_follower_name, (shield_x, shield_y) = self._closest_follower_to_shields(
+                        follower_xy, type_followers, shield_targets
+                    )
                     if closest_follower:
                         type_name = type_name_map.get(type_priority, type_priority)
                         if closest_follower_name:
                             self.device_state.logger.info(f"使用{type_name}随从[{closest_follower_name}]攻击护盾")
                         else:
                             self.device_state.logger.info(f"使用{type_name}随从攻击护盾")
-                        human_like_drag(self.device_state.u2_device, closest_follower[0], closest_follower[1], shield_x, shield_y, duration=random.uniform(*settings.get_human_like_drag_duration_range()))
+                        human_like_drag(self.device_state.u2_device, closest_follower[0], closest_follower[1], shield_x, shield_y, duration=self._drag_duration())
                         time.sleep(1)
                         break  # 已攻击则跳出类型循环
 
@@ -109,17 +174,9 @@ class GameActions:
                 if new_screenshot:
                     new_followers = self._scan_our_followers(new_screenshot)
                     self.follower_manager.update_positions(new_followers)
-                    all_followers = new_followers
 
                 # 检查更新后的随从是否还有突进/疾驰能力，没有则直接返回
-                has_attack_followers = False
-                for type_priority in ["yellow", "green"]:
-                    type_followers = [(x, y, name) for x, y, t, name in all_followers if t == type_priority]
-                    if type_followers:
-                        has_attack_followers = True
-                        break
-
-                if not has_attack_followers:
+                if not self.follower_manager.has_any_type("yellow", "green"):
                     self.device_state.logger.info("攻击后没有可用的突进/疾驰随从，停止破盾")
                     return
 
@@ -132,8 +189,17 @@ class GameActions:
             if attempt_count >= max_attempts :
                 self.device_state.logger.warning(f"达到最大破盾尝试次数({max_attempts}次)，停止破盾操作")
 
+        # 没有护盾时，突进随从攻击前的首次敌方扫描放到线程池，与疾驰随从攻击并发进行
+        # （疾驰只攻击敌方主人，不改变敌方随从，可以共用攻击前的这一帧）
+        _, yellow_followers = self.follower_manager.get_xy_by_type("yellow")
+        first_enemy_scan = None
+        if not shield_detected and yellow_followers:
+            enemy_screenshot = self.device_state.take_screenshot()
+            if enemy_screenshot:
+                first_enemy_scan = self._executor.submit(self._scan_enemy_followers, enemy_screenshot)
+
         # 没有护盾，使用绿色随从攻击敌方主人
-        green_followers = [(x, y, name) for x, y, t, name in all_followers if t == "green"]
+        _, green_followers = self.follower_manager.get_xy_by_type("green")
         if green_followers:
             for x, y, name in green_followers:
                 if name:
@@ -141,43 +207,60 @@ class GameActions:
                 else:
                     self.device_state.logger.info("使用疾驰随从攻击敌方玩家")
                 target_x, target_y = default_target
-                human_like_drag(self.device_state.u2_device, x, y, target_x, target_y, duration=random.uniform(*settings.get_human_like_drag_duration_range()))
+                human_like_drag(self.device_state.u2_device, x, y, target_x, target_y, duration=self._drag_duration())
                 time.sleep(0.45)
 
         # 使用黄色突进随从攻击敌方血量最小的随从
         if not shield_detected:
-            yellow_followers = [(x, y, name) for x, y, t, name in all_followers if t == "yellow"]
             if yellow_followers:
                 for i, (x, y, name) in enumerate(yellow_followers):
                     # 检查是否是最后一个黄色随从
                     is_last_yellow = (i == len(yellow_followers) - 1)
                     
-                    # 每次攻击前都扫描敌方随从和血量
-                    enemy_screenshot = self.device_state.take_screenshot()
-                    if enemy_screenshot:
+                    # 每次攻击前都扫描敌方随从和血量；第一次直接取后台扫描的结果
+                    if i == 0 and first_enemy_scan is not None:
+                        enemy_followers = first_enemy_scan.result()
+                    else:
+                        enemy_screenshot = self.device_state.take_screenshot()
+                        if not enemy_screenshot:
+                            self.device_state.logger.warning("截图失败，跳过攻击")
+                            continue
                         enemy_followers = self._scan_enemy_followers(enemy_screenshot)
-                        if enemy_followers:
-                            try:
-                                min_hp_follower = min(enemy_followers, key=lambda x: int(x[3]) if x[3].isdigit() else 0)
-                                enemy_x, enemy_y, _, _ = min_hp_follower
-                                if name:
-                                    self.device_state.logger.info(f"使用突进随从[{name}]攻击敌方血量较小的随从")
-                                else:
-                                    self.device_state.logger.info("使用突进随从攻击敌方血量较小的随从")
-                                human_like_drag(self.device_state.u2_device, x, y, enemy_x, enemy_y, duration=random.uniform(*settings.get_human_like_drag_duration_range()))
-                                time.sleep(1.5)
+                    if enemy_followers:
+                        try:
+                            min_hp_follower = min(enemy_followers, key=lambda x: int(x[3]) if x[3].isdigit() else 0)
+                            enemy_x, enemy_y, _, _ = min_hp_follower
+                            if name:
+                                self.device_state.logger.info(f"使用突进随从[{name}]攻击敌方血量较小的随从")
+                            else:
+                                self.device_state.logger.info("使用突进随从攻击敌方血量较小的随从")
+                            human_like_drag(self.device_state.u2_device, x, y, enemy_x, enemy_y, duration=self._drag_duration())
+                            time.sleep(1.5)
+                            
+                            # 如果是最后一个黄色随从，攻击完成后直接跳出循环，不再进行后续扫描
+                            if is_last_yellow:
+                                break
                                 
-                                # 如果是最后一个黄色随从，攻击完成后直接跳出循环，不再进行后续扫描
-                                if is_last_yellow:
-                                    break
-                                    
-                            except Exception as e:
-                                self.device_state.logger.warning(f"突进敌方最小血量随从失败: {str(e)}")
-                    else:
-                        self.device_state.logger.warning("截图失败，跳过攻击")
+                        except Exception as e:
+                            self.device_state.logger.warning(f"突进敌方最小血量随从失败: {str(e)}")
+
+    def _closest_follower_to_shields(self, follower_xy, type_followers, shield_targets):
+        """返回 ((随从x, 随从y), 随从名, 护盾坐标)：该类型随从与护盾之间距离最近的组合"""
+        # 随从 × 护盾 的距离平方矩阵一次算出；比较大小无需开方
+        shield_xy = np.asarray(shield_targets, dtype=np.int32)
+        diff = follower_xy[:, None, :] - shield_xy[None, :, :]
+        dist2 = np.einsum('fsk,fsk->fs', diff, diff)
+        follower_idx, shield_idx = np.unravel_index(int(np.argmin(dist2)), dist2.shape)
+        fx, fy, fname = type_followers[follower_idx]
+        return (fx, fy), fname, shield_targets[shield_idx]
 
     def perform_evolution_actions(self):
         """执行进化/超进化操作"""
+        # 进化与超进化次数都已用完时，不必再逐个点击随从截图识别
+        if self.device_state.evolution_point <= 0 and self.device_state.super_evolution_point <= 0:
+            self.device_state.logger.info("进化/超进化次数已用完，跳过进化")
+            return
+
         all_followers = self.follower_manager.get_positions()
         if not all_followers:
             self.device_state.logger.info("没有随从可进化")
@@ -212,38 +295,30 @@ class GameActions:
         )
         # 合并，优先进化优先卡牌
         sorted_followers = sorted_evolve_priority + sorted_others
-        # 提取位置坐标
-        positions = [pos[:2] for pos in sorted_followers]
-
-        # 遍历每个随从位置
-        for pos in positions:
-            x, y = pos
-            # 记录当前随从类型
-            follower_type = None
-            follower_name = None
-            position_tolerance = POSITION_RANDOM_RANGE["medium"]
-            for f in all_followers:
-                if abs(f[0] - x) < position_tolerance and abs(f[1] - y) < position_tolerance:  # 找到匹配的随从
-                    follower_type = f[2]
-                    follower_name = f[3] if len(f) > 3 else None
-                    break
+
+        # 遍历每个随从，类型和名称直接取自排序后的同一行，无需再按坐标回查
+        for follower in sorted_followers:
+            x, y, follower_type = follower[:3]
+            follower_name = follower[3] if len(follower) > 3 else None
+            pos = (x, y)
             # 点击该位置
             self.device_state.u2_device.click(x, y)
             time.sleep(0.5)  # 等待进化按钮出现
 
-            # 获取新截图检测进化按钮
-            new_screenshot = self.device_state.take_screenshot()
-            if new_screenshot is None:
+            # 获取新截图检测进化按钮（写入复用的BGR缓冲区）
+            new_screenshot_cv = self._grab_bgr()
+            if new_screenshot_cv is None:
                 self.device_state.logger.warning(f"位置 {pos} 无法获取截图，跳过检测")
                 time.sleep(0.1)
                 continue
 
-            # 转换为OpenCV格式
-            new_screenshot_np = np.array(new_screenshot)
-            new_screenshot_cv = cv2.cvtColor(new_screenshot_np, cv2.COLOR_RGB2BGR)
-
-            # 同时检查两个检测函数
-            max_loc, max_val = self._detect_super_evolution_button(new_screenshot_cv)
+            # 两个按钮在同一帧上批量匹配，灰度图只生成一次；对应次数已用完的按钮不再匹配
+            new_screenshot_gray = self._frame_to_gray()
+            (max_loc, max_val), (max_loc1, max_val1) = self._detect_evolution_buttons(
+                new_screenshot_cv, new_screenshot_gray,
+                detect_super=self.device_state.super_evolution_point > 0,
+                detect_evolution=self.device_state.evolution_point > 0
+            )
             if max_val >= 0.80 and max_loc is not None:
                 template_info = self._load_super_evolution_template()
                 if template_info:
@@ -257,7 +332,8 @@ class GameActions:
                         self.device_state.logger.info(f"超进化了[{follower_name}]，剩余超进化次数：{self.device_state.super_evolution_point}")
                     else:
                         self.device_state.logger.info(f"检测到超进化按钮并点击，剩余超进化次数：{self.device_state.super_evolution_point}")
-                    time.sleep(3.5)
+                    # 等待进化动画结束，画面稳定即提前继续，最长3.5秒
+                    self._wait_for_ui_settle(3.5)
 
                     # 特殊超进化后操作（如铁拳神父）
                     if follower_name and is_evolve_special_action_card(follower_name):
@@ -290,7 +366,7 @@ class GameActions:
 
                                     enemy_x, enemy_y, _, hp_value = max_hp_follower
                                     # 使用原来的随从位置作为起始点
-                                    human_like_drag(self.device_state.u2_device, pos[0], pos[1], enemy_x, enemy_y, duration=random.uniform(*settings.get_human_like_drag_duration_range()))
+                                    human_like_drag(self.device_state.u2_device, pos[0], pos[1], enemy_x, enemy_y, duration=self._drag_duration())
                                     time.sleep(1)
                                     if follower_name:
                                         self.device_state.logger.info(f"超进化了[{follower_name}]并攻击了敌方较高血量随从")
@@ -298,7 +374,6 @@ class GameActions:
                                         self.device_state.logger.info(f"超进化了突进/普通随从攻击了敌方较高血量随从")
                     break
 
-            max_loc1, max_val1 = self._detect_evolution_button(new_screenshot_cv)
             if max_val1 >= 0.80 and max_loc1 is not None:
                 template_info = self._load_evolution_template()
                 if template_info:
@@ -312,7 +387,8 @@ class GameActions:
                         self.device_state.logger.info(f"进化了[{follower_name}]，剩余进化次数：{self.device_state.evolution_point}")
                     else:
                         self.device_state.logger.info(f"执行了进化，剩余进化次数：{self.device_state.evolution_point}")
-                    time.sleep(3.5)
+                    # 等待进化动画结束，画面稳定即提前继续，最长3.5秒
+                    self._wait_for_ui_settle(3.5)
 
                     # 特殊进化后操作（如铁拳神父）
                     if follower_name and is_evolve_special_action_card(follower_name):
@@ -335,15 +411,14 @@ class GameActions:
 
     def perform_full_actions(self):
         """720P分辨率下的出牌攻击操作"""
-        from concurrent.futures import ThreadPoolExecutor
-        # 并发调用scan_enemy_ATK
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            enemy_future = executor.submit(self._scan_enemy_ATK, self.device_state.take_screenshot())
+        self._begin_turn()
+        # 并发调用scan_enemy_ATK，展牌等操作期间在后台识别
+        enemy_future = self._executor.submit(self._scan_enemy_ATK, self.device_state.take_screenshot())
         
         # 展牌一次
         self.device_state.u2_device.click(
-            SHOW_CARDS_BUTTON[0] + random.randint(SHOW_CARDS_RANDOM_X[0], SHOW_CARDS_RANDOM_X[1]),
-            SHOW_CARDS_BUTTON[1] + random.randint(SHOW_CARDS_RANDOM_Y[0], SHOW_CARDS_RANDOM_Y[1])
+            SHOW_CARDS_BUTTON[0] + self._jitter(*SHOW_CARDS_RANDOM_X),
+            SHOW_CARDS_BUTTON[1] + self._jitter(*SHOW_CARDS_RANDOM_Y)
         )
         
         
@@ -353,9 +428,10 @@ class GameActions:
         time.sleep(0.3)
         
         # 获取截图
-        screenshot = self.device_state.take_screenshot()
-        image = np.array(screenshot)
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        image = self._grab_bgr()
+        if image is None:
+            self.device_state.logger.warning("无法获取截图，跳过出牌")
+            return
         
         # 执行出牌逻辑
         self._play_cards(image)
@@ -364,8 +440,8 @@ class GameActions:
         # 点击绝对无遮挡处关闭可能扰乱识别的面板
         from src.config.game_constants import BLANK_CLICK_POSITION, BLANK_CLICK_RANDOM
         self.device_state.u2_device.click(
-            BLANK_CLICK_POSITION[0] + random.randint(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM),
-            BLANK_CLICK_POSITION[1] + random.randint(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM)
+            BLANK_CLICK_POSITION[0] + self._jitter(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM),
+            BLANK_CLICK_POSITION[1] + self._jitter(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM)
         )
         time.sleep(1.5)
 
@@ -385,10 +461,7 @@ class GameActions:
             self.follower_manager.update_positions(blue_positions)
 
         # 检查是否有疾驰或突进随从
-        followers = self.follower_manager.get_positions()
-        green_or_yellow_followers = [f for f in followers if f[2] in ['green', 'yellow']]
-
-        if green_or_yellow_followers:
+        if self.follower_manager.has_any_type("green", "yellow"):
             self.perform_follower_attacks(enemy_check)
         else:
             self.device_state.logger.info("未检测到可进行攻击的随从，跳过攻击操作")
@@ -396,33 +469,27 @@ class GameActions:
         time.sleep(1)
 
     def perform_fullPlus_actions(self):
-        """执行进化/超进化与攻击操作"""
-        from concurrent.futures import ThreadPoolExecutor
-
-        # 并发调用scan_enemy_ATK
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            enemy_future = executor.submit(self._scan_enemy_ATK, self.device_state.take_screenshot())
+        """执行进化/超进化与攻击操作。同一状态阶段内（两次操作之间）的随从扫描共用一张截图"""
+        self._begin_turn()
+        # 并发调用scan_enemy_ATK，展牌出牌期间在后台识别
+        enemy_future = self._executor.submit(self._scan_enemy_ATK, self.device_state.take_screenshot())
 
         # 展牌
         self.device_state.u2_device.click(
-            SHOW_CARDS_BUTTON[0] + random.randint(SHOW_CARDS_RANDOM_X[0], SHOW_CARDS_RANDOM_X[1]),
-            SHOW_CARDS_BUTTON[1] + random.randint(SHOW_CARDS_RANDOM_Y[0], SHOW_CARDS_RANDOM_Y[1])
+            SHOW_CARDS_BUTTON[0] + self._jitter(*SHOW_CARDS_RANDOM_X),
+            SHOW_CARDS_BUTTON[1] + self._jitter(*SHOW_CARDS_RANDOM_Y)
         )
         time.sleep(0.2)
         #移除手牌光标提高识别率
         #self.device_state.u2_device.click(DEFAULT_ATTACK_TARGET[0] + random.randint(-2,2), DEFAULT_ATTACK_TARGET[1] + random.randint(-2,2))
         time.sleep(0.3)
 
-        # 获取截图
-        screenshot = self.device_state.take_screenshot()
-        if screenshot is None:
+        # 获取截图（BGR格式，写入复用缓冲区）
+        image = self._grab_bgr()
+        if image is None:
             self.device_state.logger.warning("无法获取截图，跳过出牌")
             return
 
-        # 转换为OpenCV格式
-        image = np.array(screenshot)
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-
         # 执行出牌逻辑
         self._play_cards(image)
         time.sleep(1)
@@ -430,8 +497,8 @@ class GameActions:
         # # 点击绝对无遮挡处关闭可能扰乱识别的面板
         from src.config.game_constants import BLANK_CLICK_POSITION, BLANK_CLICK_RANDOM
         self.device_state.u2_device.click(
-            BLANK_CLICK_POSITION[0] + random.randint(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM),
-            BLANK_CLICK_POSITION[1] + random.randint(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM)
+            BLANK_CLICK_POSITION[0] + self._jitter(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM),
+            BLANK_CLICK_POSITION[1] + self._jitter(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM)
         )
         time.sleep(1.5)
 
@@ -443,29 +510,26 @@ class GameActions:
             self.device_state.logger.warning(f"敌方随从检测失败: {str(e)}")
             enemy_check = []
 
-        # 获取随从位置和类型
-        screenshot = self.device_state.take_screenshot()
-        if screenshot:
-            our_followers_positions = self._scan_our_followers(screenshot)
-            self.follower_manager.update_positions(our_followers_positions)
-        
+        # 同一阶段内的扫描共用一张截图：我方随从位置和类型、敌方随从并发识别
+        enemy_followers = []
+        phase_snapshot = self.device_state.take_screenshot()
+        if phase_snapshot:
+            our_future = self._executor.submit(self._scan_our_followers, phase_snapshot)
+            enemy_now_future = self._executor.submit(self._scan_enemy_ATK, phase_snapshot)
+            self.follower_manager.update_positions(our_future.result())
+            enemy_followers = enemy_now_future.result()
 
         # 进化/超进化条件判断：敌方有随从，或者我方绿色疾驰随从，或者有优先进化随从
         should_evolve = False
         
         # 检查敌方现在是否有随从
-        screenshot = self.device_state.take_screenshot()
-        if screenshot:
-            enemy_followers = self._scan_enemy_ATK(screenshot)
-            if enemy_followers and (self.device_state.evolution_point > 0 or self.device_state.super_evolution_point > 0):
-                should_evolve = True
-                self.device_state.logger.info(f"检测到敌方随从，满足进化/超进化条件")
+        if enemy_followers and (self.device_state.evolution_point > 0 or self.device_state.super_evolution_point > 0):
+            should_evolve = True
+            self.device_state.logger.info(f"检测到敌方随从，满足进化/超进化条件")
         
         # 检查我方是否有绿色疾驰随从
         if not should_evolve:
-            our_followers = self.follower_manager.get_positions()
-            green_followers = [f for f in our_followers if f[2] == "green"]
-            if green_followers and (self.device_state.evolution_point > 0 or self.device_state.super_evolution_point > 0):
+            if self.follower_manager.has_any_type("green") and (self.device_state.evolution_point > 0 or self.device_state.super_evolution_point > 0):
                 should_evolve = True
                 self.device_state.logger.info(f"检测到我方疾驰随从，满足进化/超进化条件")
         
@@ -486,8 +550,8 @@ class GameActions:
             # 点击空白处关闭面板
             from src.config.game_constants import BLANK_CLICK_POSITION, BLANK_CLICK_RANDOM
             self.device_state.u2_device.click(
-                BLANK_CLICK_POSITION[0] + random.randint(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM),
-                BLANK_CLICK_POSITION[1] + random.randint(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM)
+                BLANK_CLICK_POSITION[0] + self._jitter(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM),
+                BLANK_CLICK_POSITION[1] + self._jitter(-BLANK_CLICK_RANDOM, BLANK_CLICK_RANDOM)
             )
             time.sleep(1)
 
@@ -499,10 +563,7 @@ class GameActions:
 
 
         # 检查是否有疾驰或突进随从
-        can_attack_followers = self.follower_manager.get_positions()
-        can_attack_followers = [f for f in can_attack_followers if f[2] in ['green', 'yellow']]
-
-        if can_attack_followers:
+        if self.follower_manager.has_any_type("green", "yellow"):
             self.perform_follower_attacks(enemy_check)
         else:
             self.device_state.logger.info("未检测到可进行攻击的随从，跳过攻击操作")
@@ -626,9 +687,9 @@ class GameActions:
             self.device_state.logger.warning("未能识别到任何手牌")
             return
 
-        from src.config.card_priorities import get_high_priority_cards, get_card_priority
+        from src.config.card_priorities import get_high_priority_cards, get_high_priority_names
         high_priority_cards_cfg = get_high_priority_cards()
-        high_priority_names = set(high_priority_cards_cfg.keys())
+        high_priority_names = get_high_priority_names()
         
         # 过滤掉当前回合需要忽略的卡牌
         filtered_cards = [c for c in cards if c.get('name', '') not in self._current_round_ignored_cards]
@@ -638,7 +699,7 @@ class GameActions:
         # 普通卡牌
         normal_cards = [c for c in filtered_cards if c.get('name', '') not in high_priority_names]
         # 高优先级卡牌排序：先按priority（数字小优先），再按费用从高到低
-        priority_cards.sort(key=lambda x: (get_card_priority(x.get('name', '')), -x.get('cost', 0)))
+        priority_cards.sort(key=card_priority_sort_key)
         # 普通卡牌按费用从高到低排序
         normal_cards.sort(key=lambda x: x.get('cost', 0), reverse=True)
         planned_cards = priority_cards + normal_cards
@@ -657,7 +718,7 @@ class GameActions:
                 
             if affordable_priority:
                 # 高优先级卡牌按priority和费用排序（priority小优先，费用高优先）
-                affordable_priority.sort(key=lambda x: (get_card_priority(x.get('name', '')), -x.get('cost', 0)))
+                affordable_priority.sort(key=card_priority_sort_key)
                 card_to_play = affordable_priority[0]
                 self.device_state.logger.info(f"检测到高优先级卡牌[{card_to_play.get('name', '未知')}]，优先打出")
             elif normal_zero_cost:
@@ -724,7 +785,7 @@ class GameActions:
             if planned_cards and (remain_cost > 0 or any(c.get('cost', 0) == 0 for c in planned_cards)):
                 time.sleep(0.2)
                 #点击展牌位置
-                self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + random.randint(-2,2), SHOW_CARDS_BUTTON[1] + random.randint(-2,2))
+                self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + self._jitter(-2, 2), SHOW_CARDS_BUTTON[1] + self._jitter(-2, 2))
                 #移除手牌光标提高识别率
                 #self.device_state.u2_device.click(DEFAULT_ATTACK_TARGET[0] + random.randint(-2,2), DEFAULT_ATTACK_TARGET[1] + random.randint(-2,2))
                 time.sleep(1)
@@ -745,10 +806,9 @@ class GameActions:
                     planned_cards = filtered_cards
                     
                     # 重新应用优先级排序
-                    high_priority_names = set(high_priority_cards_cfg.keys())
                     priority_cards = [c for c in planned_cards if c.get('name', '') in high_priority_names]
                     normal_cards = [c for c in planned_cards if c.get('name', '') not in high_priority_names]
-                    priority_cards.sort(key=lambda x: (get_card_priority(x.get('name', '')), -x.get('cost', 0)))
+                    priority_cards.sort(key=card_priority_sort_key)
                     normal_cards.sort(key=lambda x: x.get('cost', 0), reverse=True)
                     planned_cards = priority_cards + normal_cards
                 if not new_cards:
@@ -777,10 +837,11 @@ class GameActions:
 
     def _extra_scan_after_add_newcards(self, hand_manager, high_priority_cards_cfg,last_played_card):
         """用完费用后的额外扫描逻辑"""
+        high_priority_names = frozenset(high_priority_cards_cfg)
         self.device_state.logger.info(f"检测到打出{last_played_card}用完费用，额外扫描一次手牌")
         time.sleep(0.2)
         # 点击展牌位置
-        self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + random.randint(-2,2), SHOW_CARDS_BUTTON[1] + random.randint(-2,2))
+        self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + self._jitter(-2, 2), SHOW_CARDS_BUTTON[1] + self._jitter(-2, 2))
         time.sleep(0.2)
         #移除手牌光标提高识别率
         #self.device_state.u2_device.click(DEFAULT_ATTACK_TARGET[0] + random.randint(-2,2), DEFAULT_ATTACK_TARGET[1] + random.randint(-2,2))
@@ -803,10 +864,9 @@ class GameActions:
             zero_cost_cards = [c for c in filtered_cards if c.get('cost', 0) == 0]
             if zero_cost_cards:
                 # 按优先级排序0费卡牌
-                high_priority_names = set(high_priority_cards_cfg.keys())
                 priority_zero = [c for c in zero_cost_cards if c.get('name', '') in high_priority_names]
                 normal_zero = [c for c in zero_cost_cards if c.get('name', '') not in high_priority_names]
-                priority_zero.sort(key=lambda x: (get_card_priority(x.get('name', '')), -x.get('cost', 0)))
+                priority_zero.sort(key=card_priority_sort_key)
                 normal_zero.sort(key=lambda x: x.get('cost', 0), reverse=True)
                 sorted_zero_cards = priority_zero + normal_zero
                 
@@ -824,7 +884,7 @@ class GameActions:
                 # 第二次扫描
                 time.sleep(0.5)
                 # 再次点击展牌位置
-                self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + random.randint(-2,2), SHOW_CARDS_BUTTON[1] + random.randint(-2,2))
+                self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + self._jitter(-2, 2), SHOW_CARDS_BUTTON[1] + self._jitter(-2, 2))
                 time.sleep(0.2)
                 #移除手牌光标提高识别率
                 #self.device_state.u2_device.click(DEFAULT_ATTACK_TARGET[0] + random.randint(-2,2), DEFAULT_ATTACK_TARGET[1] + random.randint(-2,2))
@@ -847,10 +907,9 @@ class GameActions:
                     zero_cost_cards = [c for c in filtered_cards if c.get('cost', 0) == 0]
                     if zero_cost_cards:
                         # 按优先级排序0费卡牌
-                        high_priority_names = set(high_priority_cards_cfg.keys())
                         priority_zero = [c for c in zero_cost_cards if c.get('name', '') in high_priority_names]
                         normal_zero = [c for c in zero_cost_cards if c.get('name', '') not in high_priority_names]
-                        priority_zero.sort(key=lambda x: (get_card_priority(x.get('name', '')), -x.get('cost', 0)))
+                        priority_zero.sort(key=card_priority_sort_key)
                         normal_zero.sort(key=lambda x: x.get('cost', 0), reverse=True)
                         sorted_zero_cards = priority_zero + normal_zero
                         
@@ -872,7 +931,7 @@ class GameActions:
             # 第二次扫描
             time.sleep(0.2)
             # 再次点击展牌位置
-            self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + random.randint(-2,2), SHOW_CARDS_BUTTON[1] + random.randint(-2,2))
+            self.device_state.u2_device.click(SHOW_CARDS_BUTTON[0] + self._jitter(-2, 2), SHOW_CARDS_BUTTON[1] + self._jitter(-2, 2))
             time.sleep(0.2)
             #移除手牌光标提高识别率
             #self.device_state.u2_device.click(DEFAULT_ATTACK_TARGET[0] + random.randint(-2,2), DEFAULT_ATTACK_TARGET[1] + random.randint(-2,2))
@@ -895,10 +954,9 @@ class GameActions:
                 zero_cost_cards = [c for c in filtered_cards if c.get('cost', 0) == 0]
                 if zero_cost_cards:
                     # 按优先级排序0费卡牌
-                    high_priority_names = set(high_priority_cards_cfg.keys())
                     priority_zero = [c for c in zero_cost_cards if c.get('name', '') in high_priority_names]
                     normal_zero = [c for c in zero_cost_cards if c.get('name', '') not in high_priority_names]
-                    priority_zero.sort(key=lambda x: (get_card_priority(x.get('name', '')), -x.get('cost', 0)))
+                    priority_zero.sort(key=card_priority_sort_key)
                     normal_zero.sort(key=lambda x: x.get('cost', 0), reverse=True)
                     sorted_zero_cards = priority_zero + normal_zero
                     
@@ -921,7 +979,7 @@ class GameActions:
     def _play_single_card(self, card):
         """打出单张牌"""
         from .card_play_special_actions import CardPlaySpecialActions
-        card_play_actions = CardPlaySpecialActions(self.device_state)
+        card_play_actions = CardPlaySpecialActions(self.device_state, self._drag_duration)
         result = card_play_actions.play_single_card(card)
         
         # 处理额外的费用奖励
@@ -1085,16 +1143,16 @@ class GameActions:
                         )
 
                         # 执行拖拽
-                        start_x = center_x + random.randint(-5, 5)
+                        start_x = center_x + self._jitter(-5, 5)
                         start_y = 516
-                        end_x = center_x + random.randint(-5, 5)
+                        end_x = center_x + self._jitter(-5, 5)
                         end_y = 208
 
                         human_like_drag(
                             self.device_state.u2_device,
                             start_x, start_y,
                             end_x, end_y,
-                            duration=random.uniform(*settings.get_human_like_drag_duration_range())
+                            duration=self._drag_duration()
                         )
 
                         time.sleep(random.uniform(0.05, 0.1))
@@ -1310,16 +1368,16 @@ class GameActions:
 
                         # 执行拖拽 (从卡牌中心向上拖动)
                         # 换牌区域Y轴: 402-633，拖拽起点大约在下方，终点在上方
-                        start_x = center_x + random.randint(-5, 5)
+                        start_x = center_x + self._jitter(-5, 5)
                         start_y = 516  # 固定拖拽起点Y坐标
-                        end_x = center_x + random.randint(-5, 5)
+                        end_x = center_x + self._jitter(-5, 5)
                         end_y = 208    # 固定拖拽终点Y坐标
 
                         human_like_drag(
                             self.device_state.u2_device,
                             start_x, start_y,
                             end_x, end_y,
-                            duration=random.uniform(*settings.get_human_like_drag_duration_range())
+                            duration=self._drag_duration()
                         )
 
                         time.sleep(random.uniform(0.05, 0.1))
@@ -1389,17 +1447,12 @@ class GameActions:
             return self.device_state.game_manager.scan_enemy_ATK(screenshot)
         return []
 
-    def _detect_evolution_button(self, screenshot):
-        """检测进化按钮是否出现，彩色"""
-        if hasattr(self.device_state, 'game_manager') and self.device_state.game_manager:
-            return self.device_state.game_manager.template_manager.detect_evolution_button(screenshot)
-        return None, 0
-
-    def _detect_super_evolution_button(self, screenshot):
-        """检测超进化按钮是否出现，彩色"""
+    def _detect_evolution_buttons(self, screenshot, gray=None, detect_super=True, detect_evolution=True):
+        """在同一帧上批量检测超进化/进化按钮，返回 (超进化结果, 进化结果)"""
         if hasattr(self.device_state, 'game_manager') and self.device_state.game_manager:
-            return self.device_state.game_manager.template_manager.detect_super_evolution_button(screenshot)
-        return None, 0
+            return self.device_state.game_manager.template_manager.detect_evolution_buttons(
+                screenshot, gray, detect_super=detect_super, detect_evolution=detect_evolution)
+        return (None, 0), (None, 0)
 
     def _load_evolution_template(self):
         """加载进化按钮模板"""
@@ -1413,9 +1466,8 @@ class GameActions:
             return self.device_state.game_manager.template_manager.load_super_evolution_template()
         return None 
 
-def human_like_drag(u2_device, x1, y1, x2, y2, duration=None):
-    """用一次swipe实现拟人拖动，兼容 uiautomator2 设备，强制参数合法"""
-    import random
+def human_like_drag(u2_device, x1, y1, x2, y2, duration):
+    """用一次swipe实现拟人拖动，兼容 uiautomator2 设备，强制参数合法；duration 由调用方给出"""
     # 屏幕分辨率范围（如有需要可根据实际设备动态获取）
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
@@ -1428,21 +1480,19 @@ def human_like_drag(u2_device, x1, y1, x2, y2, duration=None):
         return max(minv, min(maxv, val))
 
     # 起点终点加微小扰动（减少扰动范围，提高稳定性）
-    sx = clamp(x1, 0, SCREEN_WIDTH) + random.randint(-2, 2)
-    sy = clamp(y1, 0, SCREEN_HEIGHT) + random.randint(-2, 2)
-    ex = clamp(x2, 0, SCREEN_WIDTH) + random.randint(-2, 2)
-    ey = clamp(y2, 0, SCREEN_HEIGHT) + random.randint(-2, 2)
+    dx1, dy1, dx2, dy2 = np.random.randint(-2, 3, size=4).tolist()
+    sx = clamp(x1, 0, SCREEN_WIDTH) + dx1
+    sy = clamp(y1, 0, SCREEN_HEIGHT) + dy1
+    ex = clamp(x2, 0, SCREEN_WIDTH) + dx2
+    ey = clamp(y2, 0, SCREEN_HEIGHT) + dy2
     # 再次强制扰动后仍在屏幕内
     sx = clamp(sx, 0, SCREEN_WIDTH)
     sy = clamp(sy, 0, SCREEN_HEIGHT)
     ex = clamp(ex, 0, SCREEN_WIDTH)
     ey = clamp(ey, 0, SCREEN_HEIGHT)
-    if duration is None:
-        duration = random.uniform(*settings.get_human_like_drag_duration_range())
-    else:
-        try:
-            duration = float(duration)
-        except Exception:
-            duration = 0.02
-        duration = max(0.05, min(1.0, duration))  # 限制拖动时长在0.05~1秒
+    try:
+        duration = float(duration)
+    except Exception:
+        duration = 0.02
+    duration = max(0.05, min(1.0, duration))  # 限制拖动时长在0.05~1秒
     u2_device.swipe(sx, sy, ex, ey, duration) 
\ No newline at end of file
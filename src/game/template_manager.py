@@ -7,11 +7,18 @@ import cv2
 import os
 import logging
 import numpy as np
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from src.utils.resource_utils import get_resource_path
+from src.config.game_constants import EVOLVE_BUTTON_ROI
 
 logger = logging.getLogger(__name__)
 
+# 金字塔粗匹配：在 1/2 尺寸层上的最低候选分数，以及回到全分辨率精匹配时 ROI 的外扩像素
+PYRAMID_COARSE_THRESHOLD = 0.75
+PYRAMID_ROI_PAD = 8
+# 模板缩小后短边小于该值时不走金字塔，直接全分辨率匹配
+PYRAMID_MIN_TEMPLATE_SIZE = 8
+
 
 class TemplateManager:
     """模板管理器类"""
@@ -24,6 +31,9 @@ class TemplateManager:
         self.templates: Dict[str, Dict[str, Any]] = {}
         self.evolution_template = None
         self.super_evolution_template = None
+        # 是否已尝试加载进化/超进化模板（加载失败时也不再重复读取磁盘）
+        self._evolution_template_loaded = False
+        self._super_evolution_template_loaded = False
         
         # 记录模板目录选择
         logger.info(f"模板管理器初始化: 使用目录 '{self.templates_dir}'")
@@ -113,31 +123,83 @@ class TemplateManager:
             logger.error(f"无法加载模板: {path}")
         return template
 
-    def _create_template_info(self, filename: str, name: str, threshold: float = 0.85, hsv_range: dict = None) -> Optional[Dict[str, Any]]:
+    def _create_template_info(self, filename: str, name: str, threshold: float = 0.85, hsv_range: dict = None,
+                              match_method: int = cv2.TM_CCOEFF_NORMED) -> Optional[Dict[str, Any]]:
         """创建模板信息字典"""
         template_img = self._load_template(self.templates_dir, filename)
         if template_img is None:
             return None
 
-        return self._create_template_info_from_image(template_img, name, threshold, hsv_range)
+        return self._create_template_info_from_image(template_img, name, threshold, hsv_range, match_method)
 
-    def _create_template_info_from_image(self, template: np.ndarray, name: str, threshold: float = 0.85, hsv_range: dict = None) -> Dict[str, Any]:
-        """从图像创建模板信息字典，支持灰度和三通道"""
+    def _create_template_info_from_image(self, template: np.ndarray, name: str, threshold: float = 0.85, hsv_range: dict = None,
+                                         match_method: int = cv2.TM_CCOEFF_NORMED) -> Dict[str, Any]:
+        """从图像创建模板信息字典，支持灰度和三通道；三通道模板同时预先生成灰度版本"""
+        template_gray = None
+        template_small = None
         if len(template.shape) == 2:
             h, w = template.shape
         else:
             h, w, _ = template.shape
+            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            if min(h, w) // 2 >= PYRAMID_MIN_TEMPLATE_SIZE:
+                template_small = cv2.pyrDown(template_gray)
         return {
             'name': name,
             'template': template,
+            'template_gray': template_gray,  # 彩色模板的灰度版本，用于在灰度截图上匹配
+            'template_small': template_small,  # 灰度模板的金字塔下一层，用于粗定位
             'w': w,
             'h': h,
             'threshold': threshold,
-            'hsv_range': hsv_range  # 可选颜色判定区间
+            'hsv_range': hsv_range,  # 可选颜色判定区间
+            'match_method': match_method  # 灰度金字塔匹配所用方法
         }
 
-    def match_template(self, image: np.ndarray, template_info: Dict[str, Any]) -> Tuple[Optional[Tuple[int, int]], float]:
-        """执行模板匹配并返回结果，支持灰度和三通道。若模板注册了hsv_range，则匹配后自动做颜色判定。"""
+    @staticmethod
+    def _best_match(image: np.ndarray, template: np.ndarray, method: int) -> Tuple[Tuple[int, int], float]:
+        """执行一次模板匹配，返回最佳位置与相似度；平方差方法换算为 1 - 差值，统一为越大越相似"""
+        result = cv2.matchTemplate(image, template, method)
+        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        if method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
+            return (int(min_loc[0]), int(min_loc[1])), 1.0 - float(min_val)
+        return (int(max_loc[0]), int(max_loc[1])), float(max_val)
+
+    def _match_gray_pyramid(self, gray: np.ndarray, gray_small: Optional[np.ndarray],
+                            template_info: Dict[str, Any]) -> Tuple[Optional[Tuple[int, int]], float]:
+        """先在金字塔下一层粗定位，候选分数足够时只在其周围的全分辨率 ROI 内精匹配"""
+        tpl_gray = template_info['template_gray']
+        tpl_small = template_info.get('template_small')
+        method = template_info.get('match_method', cv2.TM_CCOEFF_NORMED)
+        if tpl_small is not None and gray_small is None:
+            gray_small = cv2.pyrDown(gray)
+        if (tpl_small is None or tpl_small.shape[0] > gray_small.shape[0]
+                or tpl_small.shape[1] > gray_small.shape[1]):
+            if tpl_gray.shape[0] > gray.shape[0] or tpl_gray.shape[1] > gray.shape[1]:
+                return None, 0.0
+            return self._best_match(gray, tpl_gray, method)
+
+        coarse_loc, coarse_val = self._best_match(gray_small, tpl_small, method)
+        if coarse_val < PYRAMID_COARSE_THRESHOLD:
+            return None, float(coarse_val)
+
+        h, w = tpl_gray.shape
+        x0 = max(coarse_loc[0] * 2 - PYRAMID_ROI_PAD, 0)
+        y0 = max(coarse_loc[1] * 2 - PYRAMID_ROI_PAD, 0)
+        x1 = min(coarse_loc[0] * 2 + w + PYRAMID_ROI_PAD, gray.shape[1])
+        y1 = min(coarse_loc[1] * 2 + h + PYRAMID_ROI_PAD, gray.shape[0])
+        roi = gray[y0:y1, x0:x1]
+        if roi.shape[0] < h or roi.shape[1] < w:
+            return None, float(coarse_val)
+        (x, y), score = self._best_match(roi, tpl_gray, method)
+        return (x0 + x, y0 + y), score
+
+    def match_template(self, image: np.ndarray, template_info: Dict[str, Any],
+                       gray: Optional[np.ndarray] = None,
+                       gray_small: Optional[np.ndarray] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+        """执行模板匹配并返回结果，支持灰度和三通道。若模板注册了hsv_range，则匹配后自动做颜色判定。
+        彩色模板传入 gray（image 的灰度图）时在灰度金字塔上由粗到细定位，只对命中区域取彩色像素做颜色判定；
+        gray_small 为 gray 的 pyrDown 结果，多个模板共用同一截图时可预先计算传入。"""
         if not template_info:
             return None, 0
         tpl = template_info['template']
@@ -152,8 +214,11 @@ class TemplateManager:
                 return None, float(max_val)
         # 彩色模板
         else:
-            result = cv2.matchTemplate(image, tpl, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if gray is not None and template_info.get('template_gray') is not None:
+                max_loc, max_val = self._match_gray_pyramid(gray, gray_small, template_info)
+            else:
+                result = cv2.matchTemplate(image, tpl, cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
             if max_loc is not None and isinstance(max_loc, tuple) and len(max_loc) == 2:
                 h, w, _ = tpl.shape
                 x, y = int(max_loc[0]), int(max_loc[1])
@@ -192,30 +257,69 @@ class TemplateManager:
             else:
                 return None, float(max_val)
 
+    def match_templates(self, image: np.ndarray, template_infos: List[Dict[str, Any]],
+                        gray: Optional[np.ndarray] = None) -> List[Tuple[Optional[Tuple[int, int]], float]]:
+        """在同一张截图上批量匹配多个模板：灰度图及其金字塔下一层只准备一次，供所有模板共用"""
+        if gray is None:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = np.ascontiguousarray(gray)
+        gray_small = cv2.pyrDown(gray)
+        return [self.match_template(image, info, gray, gray_small) if info else (None, 0)
+                for info in template_infos]
+
     def load_evolution_template(self) -> Optional[Dict[str, Any]]:
-        """加载进化按钮模板，完整HSV区间判定"""
-        if self.evolution_template is None:
+        """加载进化按钮模板，完整HSV区间判定；只在首次调用时读取磁盘"""
+        if not self._evolution_template_loaded:
+            self._evolution_template_loaded = True
             evo_hsv = {'min': (19, 150, 184), 'max': (25, 255, 255)}
-            self.evolution_template = self._create_template_info('evolution.png', "进化按钮", threshold=0.85, hsv_range=evo_hsv)
+            self.evolution_template = self._create_template_info('evolution.png', "进化按钮", threshold=0.85, hsv_range=evo_hsv,
+                                                                 match_method=cv2.TM_SQDIFF_NORMED)
         return self.evolution_template
 
     def load_super_evolution_template(self) -> Optional[Dict[str, Any]]:
-        """加载超进化按钮模板，完整HSV区间判定"""
-        if self.super_evolution_template is None:
+        """加载超进化按钮模板，完整HSV区间判定；只在首次调用时读取磁盘"""
+        if not self._super_evolution_template_loaded:
+            self._super_evolution_template_loaded = True
             evo_hsv = {'min': (120, 26, 129), 'max': (156, 180, 255)}
-            self.super_evolution_template = self._create_template_info('super_evolution.png', "超进化按钮", threshold=0.85, hsv_range=evo_hsv)
+            self.super_evolution_template = self._create_template_info('super_evolution.png', "超进化按钮", threshold=0.85, hsv_range=evo_hsv,
+                                                                       match_method=cv2.TM_SQDIFF_NORMED)
         return self.super_evolution_template
 
-    def detect_evolution_button(self, screenshot: np.ndarray) -> Tuple[Optional[Tuple[int, int]], float]:
-        """检测进化按钮是否出现，彩色"""
+    def detect_evolution_button(self, screenshot: np.ndarray,
+                                gray: Optional[np.ndarray] = None,
+                                gray_small: Optional[np.ndarray] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+        """检测进化按钮是否出现，彩色；可传入截图的灰度图及其金字塔下一层以在灰度上匹配"""
         evolution_info = self.load_evolution_template()
         if not evolution_info:
             return None, 0
-        return self.match_template(screenshot, evolution_info)
+        return self.match_template(screenshot, evolution_info, gray, gray_small)
 
-    def detect_super_evolution_button(self, screenshot: np.ndarray) -> Tuple[Optional[Tuple[int, int]], float]:
-        """检测超进化按钮是否出现，彩色"""
+    def detect_super_evolution_button(self, screenshot: np.ndarray,
+                                      gray: Optional[np.ndarray] = None,
+                                      gray_small: Optional[np.ndarray] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+        """检测超进化按钮是否出现，彩色；可传入截图的灰度图及其金字塔下一层以在灰度上匹配"""
         evolution_info = self.load_super_evolution_template()
         if not evolution_info:
             return None, 0
-        return self.match_template(screenshot, evolution_info) 
\ No newline at end of file
+        return self.match_template(screenshot, evolution_info, gray, gray_small)
+
+    def detect_evolution_buttons(self, screenshot: np.ndarray, gray: Optional[np.ndarray] = None,
+                                 detect_super: bool = True, detect_evolution: bool = True
+                                 ) -> Tuple[Tuple[Optional[Tuple[int, int]], float], Tuple[Optional[Tuple[int, int]], float]]:
+        """在同一张截图上一次性检测超进化与进化按钮，返回 (超进化结果, 进化结果)；未检测的一项为 (None, 0)。
+        只在 EVOLVE_BUTTON_ROI 区域内匹配，返回的坐标已换算回整张截图"""
+        infos = [
+            self.load_super_evolution_template() if detect_super else None,
+            self.load_evolution_template() if detect_evolution else None,
+        ]
+        if not any(infos):
+            return (None, 0), (None, 0)
+        x1, y1, x2, y2 = EVOLVE_BUTTON_ROI
+        roi_image = screenshot[y1:y2, x1:x2]
+        roi_gray = gray[y1:y2, x1:x2] if gray is not None else None
+        results = []
+        for loc, val in self.match_templates(roi_image, infos, roi_gray):
+            if loc is not None:
+                loc = (loc[0] + x1, loc[1] + y1)
+            results.append((loc, val))
+        return results[0], results[1]